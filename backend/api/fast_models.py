@@ -0,0 +1,81 @@
+"""
+msgspec mirrors of the protocol response models.
+
+These structs match the Pydantic models in `models.py` field-for-field but
+are built and serialized without validator dispatch, which keeps the hot
+/protocol/execute and /protocol/batch paths off the Pydantic machinery.
+The Pydantic models remain the source of truth for the OpenAPI schema.
+"""
+
+from typing import Optional, List, Dict
+
+import msgspec
+
+
+class TransmissionStats(msgspec.Struct, gc=False):
+    """Statistics about qubit transmission and sifting."""
+    total_qubits: int
+    sifted_bits: int
+    final_key_bits: int
+    sifting_efficiency: float
+    key_generation_rate: float
+
+
+class SecurityStats(msgspec.Struct, gc=False):
+    """Security and error checking statistics."""
+    qber: float
+    errors_found: int
+    bits_checked: int
+    is_secure: bool
+    security_threshold: float
+    eavesdropper_detected: bool
+
+
+class InformationTheoryStats(msgspec.Struct, gc=False):
+    """Information theory metrics."""
+    mutual_information: float
+    secure_key_rate: float
+    expected_final_bits: int
+
+
+class PerformanceStats(msgspec.Struct, gc=False):
+    """Overall performance metrics."""
+    efficiency_score: float
+    rating: str
+
+
+class EavesdropperStats(msgspec.Struct, gc=False):
+    """Eavesdropper activity statistics."""
+    total_intercepted: int
+    intercept_rate: float
+    bases_used: Dict[str, int]
+    bits_measured: Dict[str, int]
+    interception_indices: List[int]
+
+
+class KeyData(msgspec.Struct, gc=False):
+    """Final key in multiple formats."""
+    binary: str
+    hex: str
+    base64: str
+    length: int
+    quality: Dict
+
+
+class ProtocolResponse(msgspec.Struct, gc=False):
+    """Complete response from BB84 protocol execution."""
+    success: bool
+    key: KeyData
+    transmission: TransmissionStats
+    security: SecurityStats
+    information_theory: InformationTheoryStats
+    performance: PerformanceStats
+    execution_time_ms: float
+    timestamp: str  # ISO-8601, pre-formatted so encoding is a plain string copy
+    eavesdropper: Optional[EavesdropperStats] = None
+    protocol_version: str = "BB84-1.0"
+
+
+# One shared encoder instance - msgspec encoders are cheap to reuse and
+# serialize Struct graphs without an intermediate dict pass.
+ENCODER = msgspec.json.Encoder()
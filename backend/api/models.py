@@ -4,10 +4,16 @@ Pydantic models for BB84 API requests and responses.
 Defines data schemas for API endpoints with validation.
 """
 
-from pydantic import BaseModel, Field, field_validator
+# Import from the defining submodules directly so attribute resolution
+# doesn't go through pydantic's lazy top-level __getattr__ machinery.
+from pydantic.main import BaseModel
+from pydantic.fields import Field
+from pydantic.functional_validators import field_validator
 from typing import Optional, List, Dict
 from datetime import datetime
 
+import numpy as np
+
 
 class ProtocolRequest(BaseModel):
     """
@@ -201,6 +207,48 @@ class BatchProtocolResponse(BaseModel):
     execution_time_ms: float = Field(description="Total execution time")
 
 
+# Constant payloads shared by the info/threshold responses. Handing them to
+# Pydantic via default_factory avoids the deep copy it performs on mutable
+# class-level defaults at every instantiation; the endpoints serving these
+# are read-only, so sharing the same objects is safe.
+_PROTOCOL_FEATURES = [
+    "Quantum key distribution",
+    "Eavesdropper detection",
+    "Information-theoretic security",
+    "Configurable parameters"
+]
+
+_PROTOCOL_PARAMETERS = {
+    "key_length": {
+        "type": "integer",
+        "min": 64,
+        "max": 1024,
+        "default": 256,
+        "description": "Desired final key length in bits"
+    },
+    "with_eavesdropper": {
+        "type": "boolean",
+        "default": False,
+        "description": "Enable eavesdropper simulation"
+    },
+    "eavesdropper_intercept_rate": {
+        "type": "float",
+        "min": 0.0,
+        "max": 1.0,
+        "default": 0.5,
+        "description": "Fraction of qubits intercepted by Eve"
+    }
+}
+
+_INTERCEPT_RATE_EXAMPLES = [
+    {"intercept_rate": 0.0, "expected_qber": 0.0, "secure": True},
+    {"intercept_rate": 0.2, "expected_qber": 5.0, "secure": True},
+    {"intercept_rate": 0.4, "expected_qber": 10.0, "secure": True},
+    {"intercept_rate": 0.5, "expected_qber": 12.5, "secure": False},
+    {"intercept_rate": 1.0, "expected_qber": 25.0, "secure": False},
+]
+
+
 class ProtocolInfoResponse(BaseModel):
     """Information about the BB84 protocol."""
     name: str = Field(default="BB84")
@@ -208,40 +256,11 @@ class ProtocolInfoResponse(BaseModel):
         default="Bennett-Brassard 1984 Quantum Key Distribution Protocol"
     )
     version: str = Field(default="1.0")
-    
-    features: List[str] = Field(
-        default=[
-            "Quantum key distribution",
-            "Eavesdropper detection",
-            "Information-theoretic security",
-            "Configurable parameters"
-        ]
-    )
-    
-    parameters: Dict = Field(
-        default={
-            "key_length": {
-                "type": "integer",
-                "min": 64,
-                "max": 1024,
-                "default": 256,
-                "description": "Desired final key length in bits"
-            },
-            "with_eavesdropper": {
-                "type": "boolean",
-                "default": False,
-                "description": "Enable eavesdropper simulation"
-            },
-            "eavesdropper_intercept_rate": {
-                "type": "float",
-                "min": 0.0,
-                "max": 1.0,
-                "default": 0.5,
-                "description": "Fraction of qubits intercepted by Eve"
-            }
-        }
-    )
-    
+
+    features: List[str] = Field(default_factory=lambda: _PROTOCOL_FEATURES)
+
+    parameters: Dict = Field(default_factory=lambda: _PROTOCOL_PARAMETERS)
+
     security_threshold: float = Field(
         default=11.0,
         description="QBER threshold for security (percentage)"
@@ -254,26 +273,20 @@ class SecurityThresholdResponse(BaseModel):
         default=11.0,
         description="Maximum acceptable QBER percentage"
     )
-    
+
     explanation: str = Field(
         default="QBER above 11% indicates possible eavesdropping. Protocol should be aborted."
     )
-    
+
     intercept_rate_examples: List[Dict] = Field(
-        default=[
-            {"intercept_rate": 0.0, "expected_qber": 0.0, "secure": True},
-            {"intercept_rate": 0.2, "expected_qber": 5.0, "secure": True},
-            {"intercept_rate": 0.4, "expected_qber": 10.0, "secure": True},
-            {"intercept_rate": 0.5, "expected_qber": 12.5, "secure": False},
-            {"intercept_rate": 1.0, "expected_qber": 25.0, "secure": False},
-        ]
+        default_factory=lambda: _INTERCEPT_RATE_EXAMPLES
     )
 
 
 class AnalyzeEavesdropperRequest(BaseModel):
     """Request for analyzing eavesdropper impact."""
     intercept_rates: List[float] = Field(
-        default=[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+        default_factory=lambda: [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
         description="List of intercept rates to analyze"
     )
     
@@ -283,7 +296,9 @@ class AnalyzeEavesdropperRequest(BaseModel):
     @classmethod
     def validate_rates(cls, v):
         """Validate that all rates are between 0 and 1."""
-        if not all(0.0 <= rate <= 1.0 for rate in v):
+        # Single C-level bounds check instead of a per-element Python loop
+        arr = np.asarray(v, dtype=np.float64)
+        if arr.size and (arr.min() < 0.0 or arr.max() > 1.0):
             raise ValueError("All intercept rates must be between 0.0 and 1.0")
         return v
 
@@ -5,43 +5,143 @@ Provides REST endpoints for executing the BB84 protocol,
 analyzing results, and accessing protocol information.
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import msgspec
+import numpy as np
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import asyncio
+import functools
 import time
 from typing import List
 
 from core import QISKIT_AVAILABLE, QiskitBB84Protocol, BB84Protocol
-from utils.key_utils import bits_to_hex, bits_to_base64, validate_key_quality
+from utils.key_utils import bits_to_hex, bits_to_base64, bits_to_string, validate_key_quality
 from utils.statistics import (
     generate_statistics_summary,
-    calculate_expected_qber_from_intercept,
     compare_protocol_runs
 )
 from .models import (
     ProtocolRequest,
     ProtocolResponse,
-    KeyData,
-    TransmissionStats,
-    SecurityStats,
-    InformationTheoryStats,
-    PerformanceStats,
-    EavesdropperStats,
     BatchProtocolRequest,
-    BatchProtocolResponse,
     ProtocolInfoResponse,
     SecurityThresholdResponse,
     AnalyzeEavesdropperRequest,
     AnalyzeEavesdropperResponse,
     ErrorResponse
 )
+from . import fast_models
 
 # Create router
 router = APIRouter(prefix="/api", tags=["BB84 Protocol"])
 
+# Shared worker pool for batch runs, so independent protocol executions
+# overlap instead of serializing on the event loop.
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bb84-batch")
+
+# Static endpoint payloads, serialized once at import time so the
+# info/threshold/health handlers don't rebuild identical models per request.
+_INFO_BYTES = orjson.dumps(ProtocolInfoResponse().model_dump(mode="json"))
+_THRESHOLD_BYTES = orjson.dumps(SecurityThresholdResponse().model_dump(mode="json"))
+# Health payload as a templated bytes literal - load balancers poll this,
+# so only the timestamp is formatted per request.
+_HEALTH_PREFIX = (
+    b'{"status":"healthy","version":"1.0.0","qiskit_available":'
+    + (b'true' if QISKIT_AVAILABLE else b'false')
+    + b',"timestamp":"'
+)
+_HEALTH_SUFFIX = b'"}'
+
+
+@functools.lru_cache(maxsize=32)
+def _get_protocol(key_length: int, transmission_multiplier: int):
+    """
+    Cache protocol instances per configuration.
+
+    execute() keeps all run state in locals, but the instance _rng
+    Generator is shared mutable state across requests and worker
+    threads. Sharing it is still safe: the bit generator's lock
+    serializes concurrent draws, so interleaved runs see independent
+    (just not individually reproducible) streams.
+    """
+    cls = QiskitBB84Protocol if QISKIT_AVAILABLE else BB84Protocol
+    return cls(
+        key_length=key_length,
+        transmission_multiplier=transmission_multiplier
+    )
+
+
+def _build_protocol_response(request: ProtocolRequest) -> fast_models.ProtocolResponse:
+    """
+    Execute a single protocol run and assemble the response model.
+
+    Shared by the single-run and batch endpoints so batch runs don't
+    pass through the HTTP response machinery per run.
+    """
+    start_time = time.time()
+
+    # Use Qiskit if available, otherwise use pure Python implementation
+    protocol = _get_protocol(request.key_length, request.transmission_multiplier)
+    protocol_version = "BB84-Qiskit" if QISKIT_AVAILABLE else "BB84-Python"
+
+    result = protocol.execute(
+        with_eavesdropper=request.with_eavesdropper,
+        eavesdropper_intercept_rate=request.eavesdropper_intercept_rate
+    )
+
+    # Generate comprehensive statistics
+    stats = generate_statistics_summary(
+        transmitted=result.total_transmitted,
+        sifted=result.total_sifted,
+        final_key_length=result.final_key_length,
+        errors=result.errors_found,
+        checked=result.sample_size,
+        eavesdropper_present=request.with_eavesdropper
+    )
+
+    # Convert key to multiple formats. The pure-Python protocol hands
+    # back an array-backed key; box it to a list once here for the
+    # string/quality helpers.
+    final_key = result.final_key
+    if isinstance(final_key, np.ndarray):
+        final_key = final_key.tolist()
+    key_hex = bits_to_hex(final_key)
+    key_base64 = bits_to_base64(final_key)
+    key_binary = bits_to_string(final_key)
+    key_quality = validate_key_quality(final_key)
+
+    # Build response
+    # All of this data was produced by our own core and is already typed,
+    # so assemble msgspec structs directly - no validator dispatch at all.
+    return fast_models.ProtocolResponse(
+        success=True,
+        key=fast_models.KeyData(
+            binary=key_binary,
+            hex=key_hex,
+            base64=key_base64,
+            length=len(final_key),
+            quality=key_quality
+        ),
+        transmission=fast_models.TransmissionStats(**stats["transmission"]),
+        security=fast_models.SecurityStats(**stats["security"]),
+        information_theory=fast_models.InformationTheoryStats(**stats["information_theory"]),
+        performance=fast_models.PerformanceStats(**stats["performance"]),
+        eavesdropper=fast_models.EavesdropperStats(**result.eavesdropper_stats) if result.eavesdropper_stats else None,
+        execution_time_ms=(time.time() - start_time) * 1000,
+        # Reuse the clock reading taken at the start of the run instead of
+        # allocating a second datetime via utcnow()
+        timestamp=datetime.utcfromtimestamp(start_time).isoformat() + "Z",
+        protocol_version=protocol_version
+    )
+
 
 @router.post(
     "/protocol/execute",
-    response_model=ProtocolResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": ProtocolResponse}},
     status_code=status.HTTP_200_OK,
     summary="Execute BB84 Protocol",
     description="Execute BB84 using available implementation (Qiskit or Python)"
@@ -49,76 +149,30 @@ router = APIRouter(prefix="/api", tags=["BB84 Protocol"])
 async def execute_protocol(request: ProtocolRequest):
     """
     Execute BB84 protocol using available implementation.
-    
+
     Prefers Qiskit if available, falls back to pure Python implementation.
-    
+
     Returns complete protocol results including:
     - Final shared key
     - Transmission statistics
     - Security metrics (QBER)
     - Performance analysis
     """
-    
     try:
-        start_time = time.time()
-        
-        # Use Qiskit if available, otherwise use pure Python implementation
-        if QISKIT_AVAILABLE:
-            protocol = QiskitBB84Protocol(
-                key_length=request.key_length,
-                transmission_multiplier=request.transmission_multiplier
-            )
-            protocol_version = "BB84-Qiskit"
-        else:
-            protocol = BB84Protocol(
-                key_length=request.key_length,
-                transmission_multiplier=request.transmission_multiplier
-            )
-            protocol_version = "BB84-Python"
-        
-        result = protocol.execute(
-            with_eavesdropper=request.with_eavesdropper,
-            eavesdropper_intercept_rate=request.eavesdropper_intercept_rate
+        # The core protocol run is CPU-bound; run it on the worker pool so
+        # the event loop stays free to serve other requests.
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            _executor, _build_protocol_response, request
         )
-        
-        # Generate comprehensive statistics
-        stats = generate_statistics_summary(
-            transmitted=result.total_transmitted,
-            sifted=result.total_sifted,
-            final_key_length=result.final_key_length,
-            errors=result.errors_found,
-            checked=result.sample_size,
-            eavesdropper_present=request.with_eavesdropper
-        )
-        
-        # Convert key to multiple formats
-        key_hex = bits_to_hex(result.final_key)
-        key_base64 = bits_to_base64(result.final_key)
-        key_binary = ''.join(str(b) for b in result.final_key)
-        key_quality = validate_key_quality(result.final_key)
-        
-        # Build response
-        response = ProtocolResponse(
-            success=True,
-            key=KeyData(
-                binary=key_binary,
-                hex=key_hex,
-                base64=key_base64,
-                length=len(result.final_key),
-                quality=key_quality
-            ),
-            transmission=TransmissionStats(**stats["transmission"]),
-            security=SecurityStats(**stats["security"]),
-            information_theory=InformationTheoryStats(**stats["information_theory"]),
-            performance=PerformanceStats(**stats["performance"]),
-            eavesdropper=EavesdropperStats(**result.eavesdropper_stats) if result.eavesdropper_stats else None,
-            execution_time_ms=(time.time() - start_time) * 1000,
-            timestamp=datetime.utcnow(),
-            protocol_version=protocol_version
+
+        # Encode the struct graph straight to JSON bytes - no intermediate
+        # dict, no jsonable_encoder, no response_model re-validation.
+        return Response(
+            content=fast_models.ENCODER.encode(response),
+            media_type="application/json"
         )
-        
-        return response
-        
+
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -128,71 +182,70 @@ async def execute_protocol(request: ProtocolRequest):
 
 @router.post(
     "/protocol/batch",
-    response_model=BatchProtocolResponse,
     status_code=status.HTTP_200_OK,
     summary="Execute Multiple Protocol Runs",
-    description="Execute BB84 protocol multiple times and aggregate results"
+    description=(
+        "Execute BB84 protocol multiple times and stream results as NDJSON: "
+        "one line per completed run, then a final summary line"
+    )
 )
 async def execute_batch_protocol(request: BatchProtocolRequest):
     """
     Execute BB84 protocol multiple times with same configuration.
-    
+
     Useful for:
     - Statistical analysis
     - Testing protocol stability
     - Comparing different scenarios
+
+    Runs are streamed as they complete (one JSON object per line), so
+    memory stays bounded and clients see partial progress. The last line
+    carries the aggregate summary.
     """
-    try:
-        start_time = time.time()
-        
-        results = []
-        successful = 0
+    start_time = time.time()
+
+    # Execute runs concurrently on the worker pool
+    loop = asyncio.get_running_loop()
+    tasks = [
+        loop.run_in_executor(_executor, _build_protocol_response, request.config)
+        for _ in range(request.runs)
+    ]
+
+    async def _generate():
+        stats_list = []
         failed = 0
-        
-        # Execute multiple runs
-        for _ in range(request.runs):
+
+        for future in asyncio.as_completed(tasks):
             try:
-                run_result = await execute_protocol(request.config)
-                results.append(run_result)
-                successful += 1
+                run = await future
             except Exception:
                 failed += 1
-        
-        # Generate aggregate statistics
-        if results:
-            stats_list = [
-                {
-                    "transmission": r.transmission.model_dump(),
-                    "security": r.security.model_dump(),
-                    "performance": r.performance.model_dump()
-                }
-                for r in results
-            ]
-            summary = compare_protocol_runs(stats_list)
-        else:
-            summary = {}
-        
-        total_time = (time.time() - start_time) * 1000
-        
-        return BatchProtocolResponse(
-            total_runs=request.runs,
-            successful_runs=successful,
-            failed_runs=failed,
-            results=results,
-            summary=summary,
-            execution_time_ms=total_time
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Batch execution failed: {str(e)}"
-        )
+                continue
+
+            # Keep only the slices the aggregate summary needs
+            stats_list.append({
+                "transmission": msgspec.to_builtins(run.transmission),
+                "security": msgspec.to_builtins(run.security),
+                "performance": msgspec.to_builtins(run.performance)
+            })
+            yield fast_models.ENCODER.encode(run) + b"\n"
+
+        summary = compare_protocol_runs(stats_list) if stats_list else {}
+
+        yield orjson.dumps({
+            "total_runs": request.runs,
+            "successful_runs": len(stats_list),
+            "failed_runs": failed,
+            "summary": summary,
+            "execution_time_ms": (time.time() - start_time) * 1000
+        }) + b"\n"
+
+    return StreamingResponse(_generate(), media_type="application/x-ndjson")
 
 
 @router.get(
     "/protocol/info",
-    response_model=ProtocolInfoResponse,
+    responses={200: {"model": ProtocolInfoResponse}},
     status_code=status.HTTP_200_OK,
     summary="Get Protocol Information",
     description="Get information about the BB84 protocol"
@@ -200,19 +253,20 @@ async def execute_batch_protocol(request: BatchProtocolRequest):
 async def get_protocol_info():
     """
     Get information about BB84 protocol.
-    
+
     Returns:
     - Protocol name and description
     - Available features
     - Configurable parameters
     - Security threshold
     """
-    return ProtocolInfoResponse()
+    # Payload is constant - serve the bytes serialized at import time
+    return Response(content=_INFO_BYTES, media_type="application/json")
 
 
 @router.get(
     "/security/threshold",
-    response_model=SecurityThresholdResponse,
+    responses={200: {"model": SecurityThresholdResponse}},
     status_code=status.HTTP_200_OK,
     summary="Get Security Threshold Information",
     description="Get information about QBER security threshold"
@@ -220,18 +274,20 @@ async def get_protocol_info():
 async def get_security_threshold():
     """
     Get security threshold information.
-    
+
     Returns:
     - QBER threshold (11%)
     - Explanation
     - Example intercept rates and expected QBERs
     """
-    return SecurityThresholdResponse()
+    # Payload is constant - serve the bytes serialized at import time
+    return Response(content=_THRESHOLD_BYTES, media_type="application/json")
 
 
 @router.post(
     "/analyze/eavesdropper",
-    response_model=AnalyzeEavesdropperResponse,
+    response_class=ORJSONResponse,
+    responses={200: {"model": AnalyzeEavesdropperResponse}},
     status_code=status.HTTP_200_OK,
     summary="Analyze Eavesdropper Impact",
     description="Analyze how different eavesdropper intercept rates affect QBER"
@@ -246,19 +302,23 @@ async def analyze_eavesdropper(request: AnalyzeEavesdropperRequest):
     - Detection threshold
     """
     try:
-        analysis = []
-        
-        for rate in request.intercept_rates:
-            expected_qber = calculate_expected_qber_from_intercept(rate)
-            is_secure = expected_qber <= 0.11
-            
-            analysis.append({
+        # Vectorize the analytic QBER formula over all requested rates
+        rates = np.asarray(request.intercept_rates, dtype=np.float64)
+        qbers = rates * 0.25
+        secure_mask = qbers <= 0.11
+
+        analysis = [
+            {
                 "intercept_rate": round(rate * 100, 1),
-                "expected_qber": round(expected_qber * 100, 2),
-                "is_secure": is_secure,
-                "status": "Secure" if is_secure else "Detected"
-            })
-        
+                "expected_qber": round(qber * 100, 2),
+                "is_secure": secure,
+                "status": "Secure" if secure else "Detected"
+            }
+            for rate, qber, secure in zip(
+                rates.tolist(), qbers.tolist(), secure_mask.tolist()
+            )
+        ]
+
         # Find detection threshold (where QBER exceeds 11%)
         # Theoretical: 0.11 = rate * 0.25 => rate = 0.44
         detection_threshold = 0.44
@@ -269,11 +329,11 @@ async def analyze_eavesdropper(request: AnalyzeEavesdropperRequest):
             f"(corresponding to QBER > 11%)."
         )
         
-        return AnalyzeEavesdropperResponse(
-            analysis=analysis,
-            detection_threshold=detection_threshold,
-            summary=summary
-        )
+        return ORJSONResponse({
+            "analysis": analysis,
+            "detection_threshold": detection_threshold,
+            "summary": summary
+        })
         
     except Exception as e:
         raise HTTPException(
@@ -290,9 +350,8 @@ async def analyze_eavesdropper(request: AnalyzeEavesdropperRequest):
 )
 async def health_check():
     """Simple health check endpoint."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow(),
-        "version": "1.0.0",
-        "qiskit_available": QISKIT_AVAILABLE
-    }
\ No newline at end of file
+    # Only the timestamp varies; splice it into the prebuilt bytes
+    return Response(
+        content=_HEALTH_PREFIX + datetime.utcnow().isoformat().encode() + _HEALTH_SUFFIX,
+        media_type="application/json"
+    )
\ No newline at end of file
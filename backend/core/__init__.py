@@ -2,16 +2,20 @@
 Core quantum cryptography components for BB84 protocol.
 """
 
-from .qubit import Qubit, create_random_qubit, create_qubit_batch, measure_qubit_batch
+from importlib.util import find_spec
+
+from .qubit import Qubit, QubitBatch, create_random_qubit, create_qubit_batch, measure_qubit_batch
 from .eavesdropper import Eavesdropper, calculate_expected_qber, simulate_interception
 from .bb84 import BB84Protocol, BB84Result, bits_to_hex, bits_to_string
 
-# Qiskit implementations (optional)
-try:
+# Qiskit implementations (optional). The modules import qiskit lazily,
+# so probe for the packages directly instead of relying on an
+# ImportError at module load.
+if find_spec('qiskit') is not None and find_spec('qiskit_aer') is not None:
     from .qiskit_qubit import QiskitQubit, create_qiskit_qubit_batch, measure_qiskit_qubit_batch
     from .qiskit_bb84 import QiskitBB84Protocol, QiskitBB84Result
     QISKIT_AVAILABLE = True
-except ImportError:
+else:
     QISKIT_AVAILABLE = False
     QiskitQubit = None
     QiskitBB84Protocol = None
@@ -19,6 +23,7 @@ except ImportError:
 
 __all__ = [
     'Qubit',
+    'QubitBatch',
     'create_random_qubit',
     'create_qubit_batch',
     'measure_qubit_batch',
@@ -10,12 +10,124 @@ Implements the complete 6-step BB84 protocol:
 6. Privacy amplification (generate final key)
 """
 
-import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dataclasses import dataclass
+
+import numpy as np
+
 from .qubit import Qubit, BasisType
 from .eavesdropper import Eavesdropper
 
+# Basis codes: index 0 -> 'Z', 1 -> 'X' (used to decode vectorized draws)
+_BASES = np.array(['Z', 'X'])
+
+# Shared generator for vectorized random draws
+_rng = np.random.default_rng()
+
+# np.bitwise_count (hardware popcount) arrived in NumPy 2.0
+_HAS_BITWISE_COUNT = hasattr(np, 'bitwise_count')
+
+
+def measure_batch(
+    prep_bases: np.ndarray,
+    prep_bits: np.ndarray,
+    meas_bases: np.ndarray,
+    rng: np.random.Generator = _rng
+) -> np.ndarray:
+    """
+    Measure a batch of qubits in one vectorized pass.
+    
+    BB84 measurement reduces to: if the measurement basis matches the
+    preparation basis the stored bit is returned deterministically,
+    otherwise the outcome is a uniformly random bit. Computing this over
+    aligned arrays replaces one Python `Qubit.measure` call per qubit
+    with a single kernel.
+    
+    Args:
+        prep_bases: Preparation basis codes (0='Z', 1='X')
+        prep_bits: Prepared bit values
+        meas_bases: Measurement basis codes
+        rng: Generator used for the random outcomes
+        
+    Returns:
+        Array of measurement results (uint8)
+    """
+    rand = rng.integers(0, 2, len(prep_bits), dtype=np.uint8)
+    return np.where(prep_bases == meas_bases, prep_bits, rand)
+
+
+def run_bb84_counts(
+    n: int,
+    intercept_rate: float = 0.0,
+    rng: np.random.Generator = _rng,
+    sample_fraction: float = 0.1
+) -> tuple[int, int, int]:
+    """
+    Trace-free protocol run for sweeps and batch statistics.
+    
+    Runs prepare -> intercept -> measure -> sift -> estimate as pure
+    array arithmetic and returns only the aggregate counts, skipping the
+    per-run BB84Result construction and all list materialization. Use
+    this when only QBER-style numbers are needed (e.g. intercept-rate
+    sweeps); use BB84Protocol.execute() when the full trace matters.
+    
+    Args:
+        n: Number of qubits to transmit
+        intercept_rate: Fraction of qubits Eve intercepts (0 disables Eve)
+        rng: Generator used for all random draws
+        sample_fraction: Fraction of sifted bits checked for errors
+        
+    Returns:
+        Tuple of (errors, sample_size, sifted_length)
+    """
+    alice_bits = rng.integers(0, 2, n, dtype=np.uint8)
+    alice_bases = rng.integers(0, 2, n, dtype=np.uint8)
+    
+    sent_bases, sent_bits = alice_bases, alice_bits
+    if intercept_rate > 0.0:
+        mask = rng.random(n) < intercept_rate
+        eve_bases = rng.integers(0, 2, n, dtype=np.uint8)
+        eve_bits = measure_batch(alice_bases, alice_bits, eve_bases, rng)
+        sent_bases = np.where(mask, eve_bases, alice_bases)
+        sent_bits = np.where(mask, eve_bits, alice_bits)
+    
+    bob_bases = rng.integers(0, 2, n, dtype=np.uint8)
+    bob_bits = measure_batch(sent_bases, sent_bits, bob_bases, rng)
+    
+    match = alice_bases == bob_bases
+    diff = (alice_bits ^ bob_bits)[match]
+    sifted_len = len(diff)
+    
+    # An empty sifted set (possible for tiny n) means nothing to check:
+    # sample_size 0 keeps choice() on its empty-draw path instead of
+    # raising on size > population
+    sample_size = max(1, min(int(sifted_len * sample_fraction), sifted_len // 2)) if sifted_len else 0
+    checked = rng.choice(sifted_len, size=sample_size, replace=False)
+    errors = int(diff[checked].sum())
+    
+    return errors, sample_size, sifted_len
+
+
+def to_qubits(bases: np.ndarray, bits: np.ndarray) -> list[Qubit]:
+    """
+    Materialize Qubit objects from channel arrays.
+    
+    The protocol itself never allocates Qubits; this helper exists for
+    demo and visualization code that wants the object view of a channel.
+    
+    Args:
+        bases: Basis codes (0='Z', 1='X')
+        bits: Bit values
+        
+    Returns:
+        List of Qubit objects
+    """
+    return [
+        Qubit(basis, bit)
+        for basis, bit in zip(_BASES[bases].tolist(), np.asarray(bits).tolist())
+    ]
+
 
 @dataclass
 class BB84Result:
@@ -24,17 +136,18 @@ class BB84Result:
     
     Contains all intermediate and final data from the protocol run.
     """
-    # Step 1: Alice's preparation
-    alice_bits: list[int]
+    # Step 1: Alice's preparation. Bit fields are uint8 arrays straight
+    # from the pipeline; call to_lists() to materialize Python lists.
+    alice_bits: np.ndarray
     alice_bases: list[BasisType]
     
     # Step 3: Bob's measurement
-    bob_bits: list[int]
+    bob_bits: np.ndarray
     bob_bases: list[BasisType]
     
     # Step 4: Sifting
-    sifted_alice_bits: list[int]
-    sifted_bob_bits: list[int]
+    sifted_alice_bits: np.ndarray
+    sifted_bob_bits: np.ndarray
     matching_indices: list[int]
     
     # Step 5: Error estimation
@@ -45,7 +158,7 @@ class BB84Result:
     is_secure: bool
     
     # Step 6: Final key
-    final_key: list[int]
+    final_key: np.ndarray
     
     # Statistics
     total_transmitted: int
@@ -56,6 +169,23 @@ class BB84Result:
     # Eavesdropper info (if applicable)
     eavesdropper_present: bool
     eavesdropper_stats: Optional[dict] = None
+    
+    def to_lists(self) -> "BB84Result":
+        """
+        Materialize the array-backed bit fields as plain Python lists.
+        
+        Conversion boxes every bit into a PyObject, so it is deferred to
+        callers that actually need lists (JSON serialization, display);
+        numeric consumers can use the arrays directly.
+        """
+        for name in (
+            'alice_bits', 'bob_bits',
+            'sifted_alice_bits', 'sifted_bob_bits', 'final_key'
+        ):
+            value = getattr(self, name)
+            if isinstance(value, np.ndarray):
+                setattr(self, name, value.tolist())
+        return self
 
 
 class BB84Protocol:
@@ -67,7 +197,12 @@ class BB84Protocol:
     of any eavesdropping attempts.
     """
     
-    def __init__(self, key_length: int = 256, transmission_multiplier: int = 4):
+    def __init__(
+        self,
+        key_length: int = 256,
+        transmission_multiplier: int = 4,
+        seed: Optional[int] = None
+    ):
         """
         Initialize the BB84 protocol.
         
@@ -75,6 +210,8 @@ class BB84Protocol:
             key_length: Desired length of final shared key in bits
             transmission_multiplier: How many extra bits to transmit
                                     (due to sifting and error checking losses)
+            seed: Optional seed for reproducible runs; by default each
+                  instance gets fresh PCG64 entropy
         
         Raises:
             ValueError: If parameters are invalid
@@ -88,6 +225,11 @@ class BB84Protocol:
         self.key_length = key_length
         self.transmission_multiplier = transmission_multiplier
         self.qber_threshold = 0.11  # 11% security threshold
+        # Derived transmission size, computed once per configuration
+        self.total_qubits = key_length * transmission_multiplier
+        # Instance-owned generator: seedable, and avoids contending on
+        # the module-global state
+        self._rng = np.random.default_rng(seed)
     
     def execute(
         self,
@@ -105,28 +247,33 @@ class BB84Protocol:
             BB84Result containing all protocol data and final key
         """
         # Step 1: Alice prepares qubits
-        alice_bits, alice_bases, qubits = self._alice_prepare()
+        alice_bits, alice_bases = self._alice_prepare()
         
-        # Step 2: Quantum transmission (with optional Eve)
-        transmitted_qubits = qubits
+        # Steps 2+3: Quantum transmission (with optional Eve), then Bob measures
         eve_stats = None
+        bob_bases = self._rng.integers(0, 2, len(alice_bits), dtype=np.uint8)
         
         if with_eavesdropper:
-            eve = Eavesdropper(intercept_probability=eavesdropper_intercept_rate)
-            transmitted_qubits = eve.intercept(qubits)
+            # Seed Eve from our generator so a seeded protocol run is
+            # reproducible end to end
+            eve = Eavesdropper(
+                intercept_probability=eavesdropper_intercept_rate,
+                seed=int(self._rng.integers(0, 2**32))
+            )
+            sent_bases, sent_bits = eve.intercept_arrays(alice_bases, alice_bits)
             eve_stats = eve.get_statistics()
-        
-        # Step 3: Bob measures
-        bob_bits, bob_bases = self._bob_measure(transmitted_qubits)
+            bob_bits = measure_batch(sent_bases, sent_bits, bob_bases, self._rng)
+        else:
+            bob_bits = measure_batch(alice_bases, alice_bits, bob_bases, self._rng)
         
         # Step 4: Basis sifting
-        sifted_alice, sifted_bob, matching_indices = self._basis_sifting(
+        sifted_alice, sifted_diff, matching_indices = self._basis_sifting(
             alice_bits, alice_bases, bob_bits, bob_bases
         )
         
         # Step 5: Error estimation
         error_rate, errors, checked_indices, sample_size, is_secure = self._error_estimation(
-            sifted_alice, sifted_bob
+            sifted_diff
         )
         
         # Step 6: Privacy amplification
@@ -138,14 +285,19 @@ class BB84Protocol:
         final_key_length = len(final_key)
         sifting_efficiency = (total_sifted / total_transmitted * 100) if total_transmitted > 0 else 0
         
+        # Bit fields stay as the pipeline's uint8 arrays - to_lists()
+        # boxes them on demand; only the string bases are decoded here.
         return BB84Result(
             alice_bits=alice_bits,
-            alice_bases=alice_bases,
+            alice_bases=_BASES[alice_bases].tolist(),
             bob_bits=bob_bits,
-            bob_bases=bob_bases,
+            bob_bases=_BASES[bob_bases].tolist(),
             sifted_alice_bits=sifted_alice,
-            sifted_bob_bits=sifted_bob,
-            matching_indices=matching_indices,
+            # Bob's sifted bits are only needed for reporting, so they are
+            # reconstructed here from the XOR diff instead of being carried
+            # through the pipeline as a third array
+            sifted_bob_bits=sifted_alice ^ sifted_diff,
+            matching_indices=matching_indices.tolist(),
             error_rate=error_rate,
             errors_found=errors,
             checked_indices=checked_indices,
@@ -160,51 +312,128 @@ class BB84Protocol:
             eavesdropper_stats=eve_stats
         )
     
-    def _alice_prepare(self) -> tuple[list[int], list[BasisType], list[Qubit]]:
+    def execute_batch(
+        self,
+        scenarios: list[tuple[bool, float]],
+        max_workers: Optional[int] = None
+    ) -> list[BB84Result]:
         """
-        Step 1: Alice prepares qubits with random bits and bases.
+        Run independent protocol executions concurrently.
+        
+        Each scenario gets its own protocol instance seeded from this
+        one's generator, so runs never contend on shared RNG state and a
+        seeded parent still produces reproducible batches. The heavy
+        array kernels release the GIL, so a thread pool scales without
+        process-spawn overhead.
         
+        Args:
+            scenarios: List of (with_eavesdropper, intercept_rate) pairs
+            max_workers: Worker thread count (defaults to CPU-based)
+            
         Returns:
-            Tuple of (bits, bases, qubits)
+            List of BB84Result in scenario order
         """
-        n = self.key_length * self.transmission_multiplier
-        
-        # Generate random bits and bases
-        alice_bits = [random.choice([0, 1]) for _ in range(n)]
-        alice_bases = [random.choice(['Z', 'X']) for _ in range(n)]
-        
-        # Create qubits
-        qubits = [Qubit(basis, bit) for basis, bit in zip(alice_bases, alice_bits)]
-        
-        return alice_bits, alice_bases, qubits
-    
-    def _bob_measure(self, qubits: list[Qubit]) -> tuple[list[int], list[BasisType]]:
+        seeds = self._rng.integers(0, 2**32, size=len(scenarios))
+        
+        def _run(args: tuple[tuple[bool, float], int]) -> BB84Result:
+            (with_eve, rate), seed = args
+            protocol = BB84Protocol(
+                key_length=self.key_length,
+                transmission_multiplier=self.transmission_multiplier,
+                seed=int(seed)
+            )
+            return protocol.execute(
+                with_eavesdropper=with_eve,
+                eavesdropper_intercept_rate=rate
+            )
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_run, zip(scenarios, seeds.tolist())))
+    
+    def execute_fast(
+        self,
+        with_eavesdropper: bool = False,
+        eavesdropper_intercept_rate: float = 0.5
+    ) -> tuple[float, bool, np.ndarray]:
         """
-        Step 3: Bob measures qubits with random bases.
+        Key-only protocol run for throughput-sensitive callers.
+        
+        Skips everything execute() materializes for reporting - the raw
+        bit/basis traces, matching indices and eavesdropper statistics -
+        and returns just the security verdict and the key. Roughly the
+        protocol equivalent of run_bb84_counts() with a key attached.
         
         Args:
-            qubits: List of qubits received from Alice (possibly intercepted by Eve)
+            with_eavesdropper: Whether to simulate an eavesdropper
+            eavesdropper_intercept_rate: Fraction of qubits Eve intercepts
             
         Returns:
-            Tuple of (measurement_results, measurement_bases)
+            Tuple of (error_rate, is_secure, final_key array)
         """
-        n = len(qubits)
+        rng = self._rng
+        n = self.total_qubits
+        
+        alice_bits = rng.integers(0, 2, n, dtype=np.uint8)
+        alice_bases = rng.integers(0, 2, n, dtype=np.uint8)
+        
+        sent_bases, sent_bits = alice_bases, alice_bits
+        if with_eavesdropper:
+            mask = rng.random(n) < eavesdropper_intercept_rate
+            eve_bases = rng.integers(0, 2, n, dtype=np.uint8)
+            eve_bits = measure_batch(alice_bases, alice_bits, eve_bases, rng)
+            sent_bases = np.where(mask, eve_bases, alice_bases)
+            sent_bits = np.where(mask, eve_bits, alice_bits)
+        
+        bob_bases = rng.integers(0, 2, n, dtype=np.uint8)
+        bob_bits = measure_batch(sent_bases, sent_bits, bob_bases, rng)
+        
+        match = alice_bases == bob_bases
+        sifted_alice = alice_bits[match]
+        sifted_diff = (alice_bits ^ bob_bits)[match]
+        
+        m = len(sifted_diff)
+        # Guard the empty sifted set: sample_size 0 makes choice() an
+        # empty draw instead of raising on size > population
+        sample_size = max(1, min(int(m * 0.1), m // 2)) if m else 0
+        checked = rng.choice(m, size=sample_size, replace=False)
+        errors = int(sifted_diff[checked].sum())
+        
+        error_rate = errors / sample_size if sample_size > 0 else 0.0
+        is_secure = error_rate <= self.qber_threshold
+        
+        keep = np.ones(m, dtype=bool)
+        keep[checked] = False
+        final_key = sifted_alice[keep][:self.key_length]
         
-        # Bob randomly chooses measurement bases
-        bob_bases = [random.choice(['Z', 'X']) for _ in range(n)]
+        return error_rate, is_secure, final_key
+    
+    def _alice_prepare(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Step 1: Alice prepares qubits with random bits and bases.
         
-        # Bob measures each qubit
-        bob_bits = [qubit.measure(basis) for qubit, basis in zip(qubits, bob_bases)]
+        Bits and bases are kept as uint8 arrays (basis codes: 0='Z', 1='X')
+        so downstream measurement and sifting stay vectorized. Qubit
+        objects are only materialized when an eavesdropper sits on the
+        channel and needs them.
         
-        return bob_bits, bob_bases
+        Returns:
+            Tuple of (bits array, basis-code array)
+        """
+        n = self.total_qubits
+
+        # Generate random bits and bases in two vectorized draws
+        alice_bits = self._rng.integers(0, 2, n, dtype=np.uint8)
+        alice_bases = self._rng.integers(0, 2, n, dtype=np.uint8)
+
+        return alice_bits, alice_bases
     
     def _basis_sifting(
         self,
-        alice_bits: list[int],
-        alice_bases: list[BasisType],
-        bob_bits: list[int],
-        bob_bases: list[BasisType]
-    ) -> tuple[list[int], list[int], list[int]]:
+        alice_bits: np.ndarray,
+        alice_bases: np.ndarray,
+        bob_bits: np.ndarray,
+        bob_bases: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Step 4: Basis sifting - keep only bits where bases matched.
         
@@ -213,30 +442,24 @@ class BB84Protocol:
         
         Args:
             alice_bits: Alice's bit values
-            alice_bases: Alice's preparation bases
+            alice_bases: Alice's preparation basis codes
             bob_bits: Bob's measurement results
-            bob_bases: Bob's measurement bases
+            bob_bases: Bob's measurement basis codes
             
         Returns:
-            Tuple of (sifted_alice_bits, sifted_bob_bits, matching_indices)
+            Tuple of (sifted_alice_bits, sifted_diff, matching_indices),
+            where sifted_diff is the XOR of Alice's and Bob's sifted bits -
+            error estimation only needs where they disagree, and Bob's
+            sifted bits can be reconstructed as sifted_alice ^ sifted_diff
         """
-        sifted_alice = []
-        sifted_bob = []
-        matching_indices = []
+        # Bases match -> keep those bits (single boolean-mask gather)
+        mask = alice_bases == bob_bases
         
-        for i in range(len(alice_bases)):
-            if alice_bases[i] == bob_bases[i]:
-                # Bases match - keep this bit
-                sifted_alice.append(alice_bits[i])
-                sifted_bob.append(bob_bits[i])
-                matching_indices.append(i)
-        
-        return sifted_alice, sifted_bob, matching_indices
+        return alice_bits[mask], (alice_bits ^ bob_bits)[mask], np.flatnonzero(mask)
     
     def _error_estimation(
         self,
-        sifted_alice: list[int],
-        sifted_bob: list[int],
+        sifted_diff: np.ndarray,
         sample_fraction: float = 0.1
     ) -> tuple[float, int, list[int], int, bool]:
         """
@@ -246,26 +469,34 @@ class BB84Protocol:
         If error rate is too high (> 11%), eavesdropping is detected.
         
         Args:
-            sifted_alice: Alice's sifted bits
-            sifted_bob: Bob's sifted bits
+            sifted_diff: XOR of Alice's and Bob's sifted bits
             sample_fraction: Fraction of bits to check (default 10%)
             
         Returns:
             Tuple of (error_rate, errors_found, checked_indices, sample_size, is_secure)
         """
-        n = len(sifted_alice)
-        sample_size = max(1, min(int(n * sample_fraction), n // 2))
-        
-        # Randomly select indices to check
-        available_indices = list(range(n))
-        random.shuffle(available_indices)
-        checked_indices = sorted(available_indices[:sample_size])
-        
-        # Compare bits at checked indices
-        errors = sum(
-            1 for i in checked_indices
-            if sifted_alice[i] != sifted_bob[i]
-        )
+        n = len(sifted_diff)
+        # An empty sifted set (possible for tiny key lengths) degrades to
+        # an empty sample with zero errors; sample_size 0 keeps choice()
+        # on its empty-draw path instead of raising on size > population
+        sample_size = max(1, min(int(n * sample_fraction), n // 2)) if n else 0
+
+        # Randomly select indices to check - sample without replacement
+        # directly instead of shuffling an n-element list and slicing
+        checked = np.sort(self._rng.choice(n, size=sample_size, replace=False))
+        checked_indices = checked.tolist()
+        
+        # The diff array already holds the XOR; errors are its popcount
+        # at the checked positions. With NumPy >= 2.0 mask and pack the
+        # diff to 1 bit per position and count set bits in hardware;
+        # otherwise fall back to a gather + sum.
+        if _HAS_BITWISE_COUNT:
+            sample_mask = np.zeros(n, dtype=np.uint8)
+            sample_mask[checked] = 1
+            packed = np.packbits(sifted_diff & sample_mask)
+            errors = int(np.bitwise_count(packed).sum())
+        else:
+            errors = int(sifted_diff[checked].sum())
         
         # Calculate Quantum Bit Error Rate (QBER)
         error_rate = errors / sample_size if sample_size > 0 else 0.0
@@ -277,9 +508,9 @@ class BB84Protocol:
     
     def _privacy_amplification(
         self,
-        sifted_bits: list[int],
+        sifted_bits: np.ndarray,
         checked_indices: list[int]
-    ) -> list[int]:
+    ) -> np.ndarray:
         """
         Step 6: Privacy amplification - generate final secure key.
         
@@ -297,16 +528,13 @@ class BB84Protocol:
         Returns:
             Final secure key
         """
-        # Remove checked bits
-        remaining_bits = [
-            bit for i, bit in enumerate(sifted_bits)
-            if i not in checked_indices
-        ]
+        # Remove checked bits with a boolean mask - the membership test
+        # on a list made this step quadratic in the sifted length
+        keep = np.ones(len(sifted_bits), dtype=bool)
+        keep[checked_indices] = False
         
         # Take first key_length bits
-        final_key = remaining_bits[:self.key_length]
-        
-        return final_key
+        return sifted_bits[keep][:self.key_length]
 
 
 # Utility functions
@@ -320,21 +548,11 @@ def bits_to_hex(bits: list[int]) -> str:
     Returns:
         Hexadecimal string representation
     """
-    hex_string = ""
-    
-    # Process in chunks of 4 bits
-    for i in range(0, len(bits), 4):
-        chunk = bits[i:i+4]
-        
-        # Pad last chunk if necessary
-        while len(chunk) < 4:
-            chunk.append(0)
-        
-        # Convert to hex digit
-        value = chunk[0] * 8 + chunk[1] * 4 + chunk[2] * 2 + chunk[3]
-        hex_string += format(value, 'X')
-    
-    return hex_string
+    # Pack 8 bits per byte in one C pass, then use bytes.hex() for the
+    # digits; one hex digit per 4-bit chunk, zero-padded like before
+    packed = np.packbits(np.asarray(bits, dtype=np.uint8))
+    n_digits = -(-len(bits) // 4)
+    return packed.tobytes().hex().upper()[:n_digits]
 
 
 def bits_to_string(bits: list[int]) -> str:
@@ -347,7 +565,11 @@ def bits_to_string(bits: list[int]) -> str:
     Returns:
         Binary string (e.g., "10110101")
     """
-    return ''.join(str(bit) for bit in bits)
+    if len(bits) == 0:
+        return ""
+    
+    # Single C-level add + copy instead of stringifying each bit in Python
+    return (np.asarray(bits, dtype=np.uint8) + ord('0')).tobytes().decode('ascii')
 
 
 # Demo and testing
@@ -5,13 +5,18 @@ Simulates various attack strategies on quantum key distribution,
 primarily the intercept-resend attack.
 """
 
-import random
-from typing import Literal
-from .qubit import Qubit, BasisType
+from typing import Literal, Optional
+
+import numpy as np
+
+from .qubit import Qubit, QubitBatch, BasisType
 
 
 AttackStrategy = Literal['intercept-resend', 'passive']
 
+# Basis codes: index 0 -> 'Z', 1 -> 'X' (matches the encoding in core.bb84)
+_BASES = np.array(['Z', 'X'])
+
 
 class Eavesdropper:
     """
@@ -35,13 +40,19 @@ class Eavesdropper:
         eve_bases (list): Bases Eve used for measurement
     """
     
-    def __init__(self, intercept_probability: float = 0.5, strategy: AttackStrategy = 'intercept-resend'):
+    def __init__(
+        self,
+        intercept_probability: float = 0.5,
+        strategy: AttackStrategy = 'intercept-resend',
+        seed: Optional[int] = None
+    ):
         """
         Initialize the eavesdropper.
         
         Args:
             intercept_probability: Fraction of qubits to intercept (0.0 = none, 1.0 = all)
             strategy: Attack strategy to use
+            seed: Optional seed for reproducible attacks
             
         Raises:
             ValueError: If intercept_probability is not between 0 and 1
@@ -54,46 +65,118 @@ class Eavesdropper:
         
         self.intercept_probability = intercept_probability
         self.strategy = strategy
+        # Instance-owned generator: seedable, and avoids contending on
+        # the module-global state
+        self._rng = np.random.default_rng(seed)
         
         # Track Eve's activity
         self.intercepted_count = 0
         self.eve_bits = []
         self.eve_bases = []
         self.interception_indices = []
+        # Running Z/X histogram, updated at interception time so
+        # get_statistics() reads it in O(1) instead of re-counting
+        self._base_counts = np.zeros(2, dtype=np.int64)
     
-    def intercept(self, qubits: list[Qubit]) -> list[Qubit]:
+    def intercept(self, qubits) -> 'list[Qubit] | QubitBatch':
         """
-        Intercept and potentially manipulate a list of qubits.
+        Intercept and potentially manipulate a batch of qubits.
         
         For each qubit, Eve decides whether to intercept based on intercept_probability.
         If intercepted, Eve performs the chosen attack strategy.
         
         Args:
-            qubits: List of qubits transmitted from Alice to Bob
+            qubits: Qubits transmitted from Alice to Bob (list of Qubit
+                or QubitBatch)
             
         Returns:
-            List of qubits (potentially modified by Eve) that Bob receives
+            The qubits (potentially modified by Eve) that Bob receives -
+            a list for list input, a QubitBatch for batch input
         """
         if self.strategy == 'passive':
             # Passive attack: just observe, don't modify
             return qubits
         
-        # Intercept-resend attack
-        modified_qubits = []
+        if isinstance(qubits, QubitBatch):
+            # Array fast path: the whole attack runs as three bulk RNG
+            # draws plus masked assignment on the batch's code arrays.
+            # The result stays a QubitBatch - downstream consumers index
+            # or iterate it like a list, and Qubit views materialize
+            # lazily only where actually touched.
+            sent_bases, sent_bits = self.intercept_arrays(qubits.bases, qubits.bits)
+            return QubitBatch(sent_bases, sent_bits)
+        
+        # Intercept-resend attack on a list of Qubit objects.
+        # Draw the full interception mask in one Bernoulli batch instead of
+        # calling random.random() once per qubit.
+        mask = self._rng.random(len(qubits)) < self.intercept_probability
+        # The output length is known up front, so preallocate and assign
+        # by index instead of growing the list append by append
+        modified_qubits = [None] * len(qubits)
         
         for idx, qubit in enumerate(qubits):
-            if random.random() < self.intercept_probability:
+            if mask[idx]:
                 # Eve intercepts this qubit
-                intercepted_qubit = self._intercept_and_resend(qubit)
-                modified_qubits.append(intercepted_qubit)
+                modified_qubits[idx] = self._intercept_and_resend(qubit)
                 self.interception_indices.append(idx)
                 self.intercepted_count += 1
             else:
                 # Eve lets this qubit pass unchanged
-                modified_qubits.append(qubit)
+                modified_qubits[idx] = qubit
                 
         return modified_qubits
     
+    def intercept_arrays(
+        self,
+        prep_bases: np.ndarray,
+        prep_bits: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Array fast path for the intercept-resend attack.
+        
+        Operates on the (basis-code, bit) arrays the protocol carries
+        instead of Qubit objects: one Bernoulli draw selects the
+        intercepted positions, Eve's measurements are computed as a
+        batched basis-match/random-outcome pass, and the re-sent qubits
+        are written back by overwriting the intercepted positions.
+        
+        Args:
+            prep_bases: Alice's preparation basis codes (0='Z', 1='X')
+            prep_bits: Alice's prepared bit values
+            
+        Returns:
+            Tuple of (basis codes, bit values) describing the qubits
+            Bob receives
+        """
+        if self.strategy == 'passive':
+            # Passive attack: just observe, don't modify
+            return prep_bases, prep_bits
+        
+        # One vectorized Bernoulli draw for the interception mask
+        mask = self._rng.random(len(prep_bits)) < self.intercept_probability
+        indices = np.flatnonzero(mask)
+        
+        # Eve measures the intercepted qubits in random bases: matching
+        # basis returns the stored bit, wrong basis a random outcome
+        eve_bases = self._rng.integers(0, 2, len(indices), dtype=np.uint8)
+        rand = self._rng.integers(0, 2, len(indices), dtype=np.uint8)
+        eve_bits = np.where(prep_bases[indices] == eve_bases, prep_bits[indices], rand)
+        
+        # Record Eve's activity in the same form the object path uses
+        self.intercepted_count += len(indices)
+        self.interception_indices.extend(indices.tolist())
+        self.eve_bases.extend(_BASES[eve_bases].tolist())
+        self.eve_bits.extend(eve_bits.tolist())
+        self._base_counts += np.bincount(eve_bases, minlength=2)
+        
+        # Resend: overwrite the intercepted positions with Eve's state
+        sent_bases = prep_bases.copy()
+        sent_bits = prep_bits.copy()
+        sent_bases[indices] = eve_bases
+        sent_bits[indices] = eve_bits
+        
+        return sent_bases, sent_bits
+    
     def _intercept_and_resend(self, qubit: Qubit) -> Qubit:
         """
         Perform intercept-resend attack on a single qubit.
@@ -113,8 +196,10 @@ class Eavesdropper:
         Returns:
             New qubit created by Eve based on her measurement
         """
-        # Eve randomly chooses a measurement basis
-        eve_basis = random.choice(['Z', 'X'])
+        # Eve randomly chooses a measurement basis, drawn from the
+        # instance generator so a seeded Eavesdropper stays reproducible
+        # on this path too
+        eve_basis = 'X' if self._rng.integers(0, 2) else 'Z'
         
         # Eve measures the qubit (this collapses the quantum state!)
         eve_measurement = qubit.measure(eve_basis)
@@ -122,6 +207,7 @@ class Eavesdropper:
         # Record Eve's measurement
         self.eve_bits.append(eve_measurement)
         self.eve_bases.append(eve_basis)
+        self._base_counts[0 if eve_basis == 'Z' else 1] += 1
         
         # Eve creates a NEW qubit based on what she measured
         # This is the "resend" part of intercept-resend
@@ -135,6 +221,7 @@ class Eavesdropper:
         self.eve_bits = []
         self.eve_bases = []
         self.interception_indices = []
+        self._base_counts = np.zeros(2, dtype=np.int64)
     
     def get_statistics(self) -> dict:
         """
@@ -147,11 +234,15 @@ class Eavesdropper:
                 - bases_used: Count of Z and X bases used
                 - bits_measured: Count of 0s and 1s measured
         """
-        z_count = sum(1 for b in self.eve_bases if b == 'Z')
-        x_count = sum(1 for b in self.eve_bases if b == 'X')
+        # Basis counts are maintained incrementally at interception
+        # time; only the bit histogram needs a pass here
+        z_count, x_count = int(self._base_counts[0]), int(self._base_counts[1])
         
-        zero_count = sum(1 for b in self.eve_bits if b == 0)
-        one_count = sum(1 for b in self.eve_bits if b == 1)
+        if self.eve_bits:
+            bit_counts = np.bincount(np.asarray(self.eve_bits, dtype=np.uint8), minlength=2)
+            zero_count, one_count = int(bit_counts[0]), int(bit_counts[1])
+        else:
+            zero_count = one_count = 0
         
         return {
             'total_intercepted': self.intercepted_count,
@@ -208,14 +299,14 @@ def calculate_expected_qber(intercept_rate: float) -> float:
 
 
 def simulate_interception(
-    qubits: list[Qubit],
+    qubits,
     intercept_rate: float = 0.5
-) -> tuple[list[Qubit], Eavesdropper]:
+) -> 'tuple[list[Qubit] | QubitBatch, Eavesdropper]':
     """
-    Convenience function to simulate Eve's attack on a list of qubits.
+    Convenience function to simulate Eve's attack on a batch of qubits.
     
     Args:
-        qubits: List of qubits from Alice
+        qubits: Qubits from Alice (list of Qubit or QubitBatch)
         intercept_rate: Fraction of qubits to intercept
         
     Returns:
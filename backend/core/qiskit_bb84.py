@@ -4,16 +4,58 @@ Qiskit-based BB84 Protocol Implementation.
 Uses Qiskit quantum circuits for more accurate quantum simulation.
 """
 
-import random
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
+
+import numpy as np
+
+from . import qiskit_qubit
 from .qiskit_qubit import QiskitQubit, BasisType
 from .eavesdropper import Eavesdropper
 
+# Basis codes: index 0 -> 'Z', 1 -> 'X' (same encoding as core.bb84)
+_BASES = np.array(['Z', 'X'])
+
+# Hamming weight of every byte value, for popcounts over packed bits
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _execute_single(args: tuple[int, int, bool, float]) -> 'QiskitBB84Result':
+    """
+    Worker for execute_batch - one independent protocol run.
+    
+    Each protocol instance owns its generator, and the analytic
+    measurement path draws from it; qiskit_qubit's module generator
+    only backs the paths that don't take an rng (measure_count_ones,
+    the use_qiskit_shots sampling). Forked workers inherit its state,
+    which would make those fallback draws identical across runs, so
+    reseed it from OS entropy first.
+    """
+    qiskit_qubit._rng = np.random.default_rng()
+
+    key_length, transmission_multiplier, with_eavesdropper, intercept_rate = args
+    protocol = QiskitBB84Protocol(
+        key_length=key_length,
+        transmission_multiplier=transmission_multiplier
+    )
+    return protocol.execute(
+        with_eavesdropper=with_eavesdropper,
+        eavesdropper_intercept_rate=intercept_rate
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class QiskitBB84Result:
-    """Result from Qiskit-based BB84 protocol execution."""
+    """
+    Result from Qiskit-based BB84 protocol execution.
+    
+    Slotted: results are constructed once per run and never grow extra
+    attributes, so dropping the per-instance __dict__ saves a few hundred
+    bytes each and speeds up field access in the stats assembly.
+    """
     alice_bits: list[int]
     alice_bases: list[BasisType]
     bob_bits: list[int]
@@ -44,13 +86,20 @@ class QiskitBB84Protocol:
     Qiskit's state vectors and quantum operations.
     """
     
-    def __init__(self, key_length: int = 256, transmission_multiplier: int = 4):
+    def __init__(
+        self,
+        key_length: int = 256,
+        transmission_multiplier: int = 4,
+        seed: Optional[int] = None
+    ):
         """
         Initialize Qiskit-based BB84 protocol.
         
         Args:
             key_length: Desired final key length in bits
             transmission_multiplier: Transmission overhead multiplier
+            seed: Optional seed for reproducible runs; by default each
+                  instance gets fresh PCG64 entropy
         """
         if key_length <= 0:
             raise ValueError(f"Key length must be positive, got {key_length}")
@@ -61,6 +110,9 @@ class QiskitBB84Protocol:
         self.key_length = key_length
         self.transmission_multiplier = transmission_multiplier
         self.qber_threshold = 0.11
+        # Instance-owned generator: seedable, and no contention on shared
+        # module state under concurrent API use
+        self._rng = np.random.default_rng(seed)
     
     def execute(
         self,
@@ -77,39 +129,41 @@ class QiskitBB84Protocol:
         Returns:
             QiskitBB84Result with all protocol data
         """
-        # Step 1: Alice prepares qubits using Qiskit
-        alice_bits, alice_bases, qubits = self._alice_prepare()
+        # Step 1: Alice prepares her random bits and bases
+        alice_bits, alice_base_codes = self._alice_prepare()
+        n = len(alice_bits)
         
-        # Step 2: Quantum transmission (with optional Eve)
-        transmitted_qubits = qubits
+        # Steps 2+3: Quantum transmission (with optional Eve), then Bob
         eve_stats = None
         
         if with_eavesdropper:
-            # Note: Our eavesdropper works with regular Qubits
-            # For full Qiskit integration, we'd need to adapt it
-            # For now, we'll use the existing eavesdropper
-            from .qubit import Qubit
-            
-            # Convert Qiskit qubits to regular qubits for Eve
-            regular_qubits = [
-                Qubit(q.basis, q.bit_value) for q in qubits
-            ]
-            
-            eve = Eavesdropper(intercept_probability=eavesdropper_intercept_rate)
-            intercepted_regular = eve.intercept(regular_qubits)
+            # Eve's attack runs directly on the basis/bit arrays - no
+            # QiskitQubit -> Qubit -> QiskitQubit round trip, which used
+            # to rebuild every circuit twice on this path. Seed her from
+            # our generator so a seeded run is reproducible end to end.
+            eve = Eavesdropper(
+                intercept_probability=eavesdropper_intercept_rate,
+                seed=int(self._rng.integers(0, 2**32))
+            )
+            sent_base_codes, sent_bits = eve.intercept_arrays(alice_base_codes, alice_bits)
             eve_stats = eve.get_statistics()
             
-            # Convert back to Qiskit qubits
-            transmitted_qubits = [
-                QiskitQubit(q.basis, q.bit_value) for q in intercepted_regular
+            # The re-sent qubits are plain (basis, bit) states, so Bob's
+            # outcomes follow the analytic BB84 distribution
+            bob_base_codes = self._rng.integers(0, 2, n, dtype=np.uint8)
+            rand = self._rng.integers(0, 2, n, dtype=np.uint8)
+            bob_bits = np.where(sent_base_codes == bob_base_codes, sent_bits, rand)
+        else:
+            # Materialize the Qiskit qubits only on the path that uses them
+            qubits = [
+                QiskitQubit(basis, bit)
+                for basis, bit in zip(_BASES[alice_base_codes].tolist(), alice_bits.tolist())
             ]
-        
-        # Step 3: Bob measures using Qiskit
-        bob_bits, bob_bases = self._bob_measure(transmitted_qubits)
+            bob_bits, bob_base_codes = self._bob_measure(qubits)
         
         # Step 4: Basis sifting
         sifted_alice, sifted_bob, matching_indices = self._basis_sifting(
-            alice_bits, alice_bases, bob_bits, bob_bases
+            alice_bits, alice_base_codes, bob_bits, bob_base_codes
         )
         
         # Step 5: Error estimation
@@ -127,13 +181,13 @@ class QiskitBB84Protocol:
         sifting_efficiency = (total_sifted / total_transmitted * 100) if total_transmitted > 0 else 0
         
         return QiskitBB84Result(
-            alice_bits=alice_bits,
-            alice_bases=alice_bases,
-            bob_bits=bob_bits,
-            bob_bases=bob_bases,
-            sifted_alice_bits=sifted_alice,
-            sifted_bob_bits=sifted_bob,
-            matching_indices=matching_indices,
+            alice_bits=alice_bits.tolist(),
+            alice_bases=_BASES[alice_base_codes].tolist(),
+            bob_bits=bob_bits.tolist(),
+            bob_bases=_BASES[bob_base_codes].tolist(),
+            sifted_alice_bits=sifted_alice.tolist(),
+            sifted_bob_bits=sifted_bob.tolist(),
+            matching_indices=matching_indices.tolist(),
             error_rate=error_rate,
             errors_found=errors,
             checked_indices=checked_indices,
@@ -148,27 +202,58 @@ class QiskitBB84Protocol:
             eavesdropper_stats=eve_stats
         )
     
-    def _alice_prepare(self) -> tuple[list[int], list[BasisType], list[QiskitQubit]]:
+    def execute_batch(
+        self,
+        n_runs: int,
+        with_eavesdropper: bool = False,
+        eavesdropper_intercept_rate: float = 0.5,
+        max_workers: Optional[int] = None
+    ) -> list[QiskitBB84Result]:
         """
-        Step 1: Alice prepares qubits using Qiskit quantum circuits.
+        Run several independent protocol executions in parallel.
+        
+        Protocol runs share no state, so they scale across cores with a
+        process pool (thread pool on Windows, where process spawn cost
+        and pickling make processes a poor fit). Each worker reseeds its
+        RNG so forked children don't replay identical draws.
         
+        Args:
+            n_runs: Number of independent executions
+            with_eavesdropper: Whether each run simulates an eavesdropper
+            eavesdropper_intercept_rate: Fraction of qubits Eve intercepts
+            max_workers: Pool size (defaults to the CPU count)
+            
         Returns:
-            Tuple of (bits, bases, qiskit_qubits)
+            List of QiskitBB84Result, one per run
         """
-        n = self.key_length * self.transmission_multiplier
+        executor_cls = ThreadPoolExecutor if sys.platform == 'win32' else ProcessPoolExecutor
+        args = [
+            (self.key_length, self.transmission_multiplier,
+             with_eavesdropper, eavesdropper_intercept_rate)
+        ] * n_runs
         
-        alice_bits = [random.choice([0, 1]) for _ in range(n)]
-        alice_bases = [random.choice(['Z', 'X']) for _ in range(n)]
+        with executor_cls(max_workers=max_workers or os.cpu_count()) as pool:
+            return list(pool.map(_execute_single, args))
+    
+    def _alice_prepare(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Step 1: Alice prepares her random bits and bases.
         
-        # Create Qiskit qubits
-        qubits = [
-            QiskitQubit(basis, bit)
-            for basis, bit in zip(alice_bases, alice_bits)
-        ]
+        Bits and bases come from two vectorized draws and stay as uint8
+        arrays (basis codes: 0='Z', 1='X'); QiskitQubit objects are
+        materialized by the caller only on the path that measures them.
         
-        return alice_bits, alice_bases, qubits
+        Returns:
+            Tuple of (bits array, basis-code array)
+        """
+        n = self.key_length * self.transmission_multiplier
+        
+        alice_bits = self._rng.integers(0, 2, n, dtype=np.uint8)
+        alice_bases = self._rng.integers(0, 2, n, dtype=np.uint8)
+        
+        return alice_bits, alice_bases
     
-    def _bob_measure(self, qubits: list[QiskitQubit]) -> tuple[list[int], list[BasisType]]:
+    def _bob_measure(self, qubits: list[QiskitQubit]) -> tuple[np.ndarray, np.ndarray]:
         """
         Step 3: Bob measures qubits using Qiskit simulation.
         
@@ -176,57 +261,54 @@ class QiskitBB84Protocol:
             qubits: List of Qiskit qubits
             
         Returns:
-            Tuple of (measurement_results, measurement_bases)
+            Tuple of (measurement results array, measurement basis-code array)
         """
         n = len(qubits)
-        bob_bases = [random.choice(['Z', 'X']) for _ in range(n)]
         
-        # Measure each qubit using Qiskit
-        bob_bits = [
-            qubit.measure(basis)
-            for qubit, basis in zip(qubits, bob_bases)
-        ]
+        # One vectorized draw for Bob's bases
+        bob_bases = self._rng.integers(0, 2, n, dtype=np.uint8)
+        
+        # Measure the whole batch in one submission instead of a call
+        # per qubit, drawing the random outcomes from the instance
+        # generator so seeded runs stay reproducible
+        bob_bits = QiskitQubit.measure_many(qubits, _BASES[bob_bases].tolist(), rng=self._rng)
         
-        return bob_bits, bob_bases
+        return np.asarray(bob_bits, dtype=np.uint8), bob_bases
     
     def _basis_sifting(
         self,
-        alice_bits: list[int],
-        alice_bases: list[BasisType],
-        bob_bits: list[int],
-        bob_bases: list[BasisType]
-    ) -> tuple[list[int], list[int], list[int]]:
-        """Step 4: Basis sifting."""
-        sifted_alice = []
-        sifted_bob = []
-        matching_indices = []
+        alice_bits: np.ndarray,
+        alice_bases: np.ndarray,
+        bob_bits: np.ndarray,
+        bob_bases: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Step 4: Basis sifting via one boolean-mask gather."""
+        mask = alice_bases == bob_bases
         
-        for i in range(len(alice_bases)):
-            if alice_bases[i] == bob_bases[i]:
-                sifted_alice.append(alice_bits[i])
-                sifted_bob.append(bob_bits[i])
-                matching_indices.append(i)
-        
-        return sifted_alice, sifted_bob, matching_indices
+        return alice_bits[mask], bob_bits[mask], np.flatnonzero(mask)
     
     def _error_estimation(
         self,
-        sifted_alice: list[int],
-        sifted_bob: list[int],
+        sifted_alice: np.ndarray,
+        sifted_bob: np.ndarray,
         sample_fraction: float = 0.1
     ) -> tuple[float, int, list[int], int, bool]:
         """Step 5: Error estimation."""
         n = len(sifted_alice)
-        sample_size = max(1, min(int(n * sample_fraction), n // 2))
+        # An empty sifted set degrades to an empty sample with zero
+        # errors; sample_size 0 keeps choice() on its empty-draw path
+        # instead of raising on size > population
+        sample_size = max(1, min(int(n * sample_fraction), n // 2)) if n else 0
         
-        available_indices = list(range(n))
-        random.shuffle(available_indices)
-        checked_indices = sorted(available_indices[:sample_size])
+        # Sample without replacement and count mismatches with one
+        # XOR + popcount pass
+        checked = np.sort(self._rng.choice(n, size=sample_size, replace=False))
+        checked_indices = checked.tolist()
         
-        errors = sum(
-            1 for i in checked_indices
-            if sifted_alice[i] != sifted_bob[i]
-        )
+        # Pack the XOR diff to one bit per position and sum Hamming
+        # weights through the byte LUT - 8 comparisons per table lookup
+        diff = sifted_alice[checked] ^ sifted_bob[checked]
+        errors = int(_POPCOUNT[np.packbits(diff)].sum())
         
         error_rate = errors / sample_size if sample_size > 0 else 0.0
         is_secure = error_rate <= self.qber_threshold
@@ -235,16 +317,15 @@ class QiskitBB84Protocol:
     
     def _privacy_amplification(
         self,
-        sifted_bits: list[int],
+        sifted_bits: np.ndarray,
         checked_indices: list[int]
     ) -> list[int]:
         """Step 6: Privacy amplification."""
-        remaining_bits = [
-            bit for i, bit in enumerate(sifted_bits)
-            if i not in checked_indices
-        ]
+        # Boolean keep-mask instead of a per-bit list membership test
+        keep = np.ones(len(sifted_bits), dtype=bool)
+        keep[checked_indices] = False
         
-        return remaining_bits[:self.key_length]
+        return sifted_bits[keep][:self.key_length].tolist()
 
 
 # Demo
@@ -5,14 +5,123 @@ Uses actual quantum circuits and state vectors from Qiskit
 to simulate quantum behavior more accurately.
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit_aer import AerSimulator
-from qiskit.quantum_info import Statevector
-import random
-from typing import Literal
+import functools
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+# Qiskit is imported lazily inside the cached builders below: importing
+# qiskit + qiskit_aer costs on the order of a second, and callers that
+# never construct a circuit (argument validation, analytic measurement)
+# should not pay it at module load.
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Statevector
+    from qiskit_aer import AerSimulator
 
 BasisType = Literal['Z', 'X']
 
+# Shared generator for the analytic measurement fast path
+_rng = np.random.default_rng()
+
+# Shared simulator instance, created on first use. Constructing an
+# AerSimulator per measurement dominates the cost of the 1-shot jobs.
+_SIMULATOR = None
+
+
+def _get_simulator() -> 'AerSimulator':
+    """Return the lazily created module-wide AerSimulator."""
+    global _SIMULATOR
+    if _SIMULATOR is None:
+        from qiskit_aer import AerSimulator
+        _SIMULATOR = AerSimulator()
+    return _SIMULATOR
+
+
+@functools.lru_cache(maxsize=4)
+def _prep_circuit(basis: BasisType, bit_value: int) -> 'QuantumCircuit':
+    """
+    Build (and cache) the preparation circuit for one BB84 state.
+    
+    Z-basis:
+        |0⟩ - no gates
+        |1⟩ - X gate
+    
+    X-basis:
+        |+⟩ - H gate
+        |−⟩ - X gate then H gate
+    
+    Only four circuits exist and they are treated as immutable, so each
+    is built once and shared by every qubit with that state.
+    """
+    from qiskit import QuantumCircuit
+    
+    circuit = QuantumCircuit(1, 1)
+    if bit_value == 1:
+        circuit.x(0)
+    if basis == 'X':
+        circuit.h(0)
+    return circuit
+
+
+@functools.lru_cache(maxsize=4)
+def _statevector(basis: BasisType, bit_value: int) -> 'Statevector':
+    """
+    Build (and cache) the statevector for one of the four BB84 states.
+    
+    Only |0>, |1>, |+> and |-> ever occur, and Statevector objects are
+    immutable, so each is constructed once and shared.
+    """
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Statevector
+    
+    circuit = QuantumCircuit(1)
+    if bit_value == 1:
+        circuit.x(0)
+    if basis == 'X':
+        circuit.h(0)
+    return Statevector.from_instruction(circuit)
+
+
+@functools.lru_cache(maxsize=8)
+def _measurement_circuit(basis: BasisType, bit_value: int, measurement_basis: BasisType) -> 'QuantumCircuit':
+    """
+    Build (and cache) the prep+measure circuit for one configuration.
+    
+    Only 8 (basis, bit, measurement basis) combinations exist, and the
+    circuits are never mutated after construction, so each is built once
+    and shared by every measurement with that configuration.
+    """
+    from qiskit import QuantumCircuit
+    
+    circuit = QuantumCircuit(1, 1)
+    if bit_value == 1:
+        circuit.x(0)
+    if basis == 'X':
+        circuit.h(0)
+    if measurement_basis == 'X':
+        circuit.h(0)
+    circuit.measure(0, 0)
+    return circuit
+
+
+@functools.lru_cache(maxsize=8)
+def _transpiled_measurement_circuit(
+    basis: BasisType, bit_value: int, measurement_basis: BasisType
+) -> 'QuantumCircuit':
+    """
+    Transpile (and cache) the measurement circuit for the shared simulator.
+    
+    With only 8 configurations the transpiled form can be cached too, so
+    repeated runs skip Aer's per-submission lowering pass entirely.
+    """
+    from qiskit import transpile
+    
+    return transpile(
+        _measurement_circuit(basis, bit_value, measurement_basis),
+        _get_simulator()
+    )
+
 
 class QiskitQubit:
     """
@@ -22,6 +131,11 @@ class QiskitQubit:
     the simplified custom implementation.
     """
     
+    # Batches allocate many of these; slots drop the per-instance
+    # __dict__ and give C-level attribute access (the statevector is a
+    # property over the module-level cache, so it needs no slot)
+    __slots__ = ('basis', 'bit_value', 'circuit')
+    
     def __init__(self, basis: BasisType, bit_value: int):
         """
         Initialize a qubit using Qiskit quantum circuit.
@@ -39,42 +153,35 @@ class QiskitQubit:
         self.basis = basis
         self.bit_value = bit_value
         
-        # Create quantum circuit
-        self.circuit = QuantumCircuit(1, 1)
-        
-        # Prepare state based on basis and bit
-        self._prepare_state()
-        
-        # Get state vector for visualization
-        self.statevector = Statevector.from_instruction(self.circuit.remove_final_measurements(inplace=False))
+        # Shared immutable prep circuit - nothing downstream mutates it
+        # (measurement uses its own cached circuits)
+        self.circuit = _prep_circuit(basis, bit_value)
     
-    def _prepare_state(self):
+    @property
+    def statevector(self) -> 'Statevector':
         """
-        Prepare quantum state based on basis and bit value.
-        
-        Z-basis:
-            |0⟩ - no gates
-            |1⟩ - X gate
+        State vector for visualization.
         
-        X-basis:
-            |+⟩ - H gate
-            |−⟩ - X gate then H gate
+        Computed lazily: the protocol's hot path never reads it, and the
+        four possible vectors are cached at module scope, so constructing
+        a qubit no longer runs a statevector simulation.
         """
-        if self.basis == 'Z':
-            if self.bit_value == 1:
-                self.circuit.x(0)  # |1⟩ state
-            # |0⟩ state - no operation needed
-        else:  # X-basis
-            if self.bit_value == 1:
-                self.circuit.x(0)  # First create |1⟩
-            self.circuit.h(0)  # Apply Hadamard to create |+⟩ or |−⟩
+        return _statevector(self.basis, self.bit_value)
     
-    def measure(self, measurement_basis: BasisType) -> int:
+    def measure(self, measurement_basis: BasisType, use_qiskit_shots: bool = False) -> int:
         """
-        Measure the qubit in a given basis using Qiskit simulator.
+        Measure the qubit in a given basis.
+        
+        BB84 only ever prepares the four pure states {|0>, |1>, |+>, |->},
+        so the outcome distribution is known analytically: a matching
+        basis returns the stored bit deterministically, a mismatched one
+        is a fair coin flip. The default path samples that distribution
+        directly; pass use_qiskit_shots=True to run an actual 1-shot
+        simulator job (e.g. for noisy-backend experiments).
         
         Args:
             measurement_basis: The basis to measure in ('Z' or 'X')
+            use_qiskit_shots: Run the measurement through AerSimulator
             
         Returns:
             Measurement outcome: 0 or 1
@@ -82,19 +189,18 @@ class QiskitQubit:
         if measurement_basis not in ['Z', 'X']:
             raise ValueError(f"Measurement basis must be 'Z' or 'X', got '{measurement_basis}'")
         
-        # Create a copy of the circuit for measurement
-        measure_circuit = self.circuit.copy()
+        if not use_qiskit_shots:
+            # Analytic fast path - deterministic on basis match, 50/50 otherwise
+            if measurement_basis == self.basis:
+                return self.bit_value
+            return int(_rng.integers(0, 2))
         
-        # If measuring in X-basis, apply Hadamard before measurement
-        if measurement_basis == 'X':
-            measure_circuit.h(0)
+        # Reuse the cached, pre-transpiled circuit for this configuration
+        # and the shared simulator - no per-call circuit copy, backend
+        # construction or transpilation
+        measure_circuit = _transpiled_measurement_circuit(self.basis, self.bit_value, measurement_basis)
         
-        # Add measurement
-        measure_circuit.measure(0, 0)
-        
-        # Simulate measurement
-        simulator = AerSimulator()
-        job = simulator.run(measure_circuit, shots=1)
+        job = _get_simulator().run(measure_circuit, shots=1)
         result = job.result()
         counts = result.get_counts()
         
@@ -103,15 +209,131 @@ class QiskitQubit:
         
         return measured_bit
     
-    def get_state_vector(self) -> tuple:
+    def measure_count_ones(self, measurement_basis: BasisType, shots: int) -> int:
+        """
+        Count the 1-outcomes of repeated measurements without
+        materializing them.
+        
+        The BB84 outcome distribution is analytic (see measure()), so
+        the tally is the stored bit times shots on a basis match and a
+        single binomial draw otherwise - no per-shot sampling or list.
+        
+        Args:
+            measurement_basis: The basis to measure in ('Z' or 'X')
+            shots: Number of measurements to take
+            
+        Returns:
+            Number of measurements that returned 1
+            
+        Raises:
+            ValueError: If measurement_basis is not 'Z' or 'X'
+        """
+        if measurement_basis not in ['Z', 'X']:
+            raise ValueError(f"Measurement basis must be 'Z' or 'X', got '{measurement_basis}'")
+        
+        if measurement_basis == self.basis:
+            return shots * self.bit_value
+        
+        return int(_rng.binomial(shots, 0.5))
+    
+    @classmethod
+    def measure_many(
+        cls,
+        qubits: list['QiskitQubit'],
+        bases: list[BasisType],
+        use_qiskit_shots: bool = False,
+        rng: 'np.random.Generator | None' = None
+    ) -> list[int]:
+        """
+        Measure a batch of qubits in one pass.
+        
+        By default samples the analytic BB84 outcome distribution with a
+        single vectorized draw (see measure()); with use_qiskit_shots=True
+        buckets the batch by its (preparation basis, bit, measurement
+        basis) configuration - only 8 exist - and runs each bucket's
+        cached single-qubit circuit once with shots equal to the bucket
+        size, so the simulator is launched at most 8 times regardless of
+        batch size.
+        
+        Args:
+            qubits: List of qubits to measure
+            bases: List of measurement bases (one for each qubit)
+            use_qiskit_shots: Run the measurements through AerSimulator
+            rng: Generator for the analytic path's random outcomes;
+                 defaults to the module generator. Pass a seeded one
+                 for reproducible measurements.
+
+        Returns:
+            List of measurement outcomes (0s and 1s)
+
+        Raises:
+            ValueError: If lengths differ or a basis is invalid
+        """
+        if len(qubits) != len(bases):
+            raise ValueError(f"Number of qubits ({len(qubits)}) must match number of bases ({len(bases)})")
+        
+        if not qubits:
+            return []
+        
+        for basis in bases:
+            if basis not in ['Z', 'X']:
+                raise ValueError(f"Measurement basis must be 'Z' or 'X', got '{basis}'")
+        
+        if not use_qiskit_shots:
+            # Analytic fast path: one vectorized Bernoulli draw covers
+            # every mismatched-basis outcome
+            n = len(qubits)
+            match = np.fromiter(
+                (qubit.basis == basis for qubit, basis in zip(qubits, bases)),
+                dtype=bool,
+                count=n
+            )
+            bits = np.fromiter((qubit.bit_value for qubit in qubits), dtype=np.uint8, count=n)
+            rand = (rng if rng is not None else _rng).integers(0, 2, n, dtype=np.uint8)
+            return np.where(match, bits, rand).tolist()
+        
+        # Bucket by configuration: only 8 (preparation basis, bit,
+        # measurement basis) combinations exist, so the whole batch
+        # reduces to at most 8 single-qubit jobs - each reusing its
+        # cached, pre-transpiled circuit with shots=bucket_size - and a
+        # scatter of the per-shot outcomes back to qubit order.
+        n = len(qubits)
+        codes = np.fromiter(
+            (
+                (qubit.basis == 'X') << 2 | qubit.bit_value << 1 | (basis == 'X')
+                for qubit, basis in zip(qubits, bases)
+            ),
+            dtype=np.uint8,
+            count=n
+        )
+        
+        simulator = _get_simulator()
+        outcomes = np.empty(n, dtype=np.uint8)
+        for code in np.unique(codes):
+            indices = np.flatnonzero(codes == code)
+            circuit = _transpiled_measurement_circuit(
+                'X' if code & 4 else 'Z',
+                (code >> 1) & 1,
+                'X' if code & 1 else 'Z'
+            )
+            job = simulator.run(circuit, shots=len(indices), memory=True)
+            # Single-qubit circuit, so each memory entry is '0' or '1';
+            # decode the shot list in one bulk pass
+            memory = job.result().get_memory()
+            outcomes[indices] = np.frombuffer(''.join(memory).encode(), dtype=np.uint8) - ord('0')
+        
+        return outcomes.tolist()
+    
+    def get_state_vector(self) -> np.ndarray:
         """
         Get the quantum state vector representation.
         
         Returns:
-            Tuple of complex amplitudes (α, β) where state = α|0⟩ + β|1⟩
+            Two-element complex128 array (α, β) where state = α|0⟩ + β|1⟩.
+            This is a view of the cached statevector's buffer - no Python
+            complex objects are boxed; index it like the old tuple.
         """
-        data = self.statevector.data
-        return (complex(data[0]), complex(data[1]))
+        return self.statevector.data[:2]
     
     def get_state(self) -> str:
         """
@@ -153,29 +375,39 @@ def create_qiskit_qubit_batch(count: int) -> list[QiskitQubit]:
     Returns:
         List of randomly generated Qiskit qubits
     """
-    qubits = []
-    for _ in range(count):
-        basis = random.choice(['Z', 'X'])
-        bit = random.choice([0, 1])
-        qubits.append(QiskitQubit(basis, bit))
-    return qubits
+    # Two vectorized draws instead of 2*count random.choice calls
+    bits = _rng.integers(0, 2, count, dtype=np.uint8).tolist()
+    bases = _rng.integers(0, 2, count, dtype=np.uint8).tolist()
+    
+    return [
+        QiskitQubit('X' if base else 'Z', bit)
+        for base, bit in zip(bases, bits)
+    ]
 
 
-def measure_qiskit_qubit_batch(qubits: list[QiskitQubit], bases: list[BasisType]) -> list[int]:
+def measure_qiskit_qubit_batch(
+    qubits: list[QiskitQubit],
+    bases: list[BasisType],
+    use_qiskit_shots: bool = False,
+    rng: 'np.random.Generator | None' = None
+) -> list[int]:
     """
     Measure a batch of Qiskit qubits with specified bases.
-    
+
+    Delegates to QiskitQubit.measure_many, so the whole batch is one
+    vectorized analytic draw by default, or at most 8 bucketed simulator
+    jobs with use_qiskit_shots=True - never a per-qubit dispatch.
+
     Args:
         qubits: List of Qiskit qubits to measure
         bases: List of measurement bases (one for each qubit)
-        
+        use_qiskit_shots: Run the measurements through AerSimulator
+        rng: Optional generator for the analytic path's random outcomes
+
     Returns:
         List of measurement outcomes (0s and 1s)
     """
-    if len(qubits) != len(bases):
-        raise ValueError(f"Number of qubits ({len(qubits)}) must match number of bases ({len(bases)})")
-    
-    return [qubit.measure(basis) for qubit, basis in zip(qubits, bases)]
+    return QiskitQubit.measure_many(qubits, bases, use_qiskit_shots=use_qiskit_shots, rng=rng)
 
 
 # Demo and testing
@@ -5,11 +5,25 @@ This module implements quantum bit (qubit) representation and measurement
 using Z-basis (computational) and X-basis (Hadamard).
 """
 
-import random
-from typing import Literal
+from typing import Iterator, Literal, Union
+
+import numpy as np
 
 BasisType = Literal['Z', 'X']
 
+# Basis codes: index 0 -> 'Z', 1 -> 'X' (matches the encoding in core.bb84)
+_BASIS_NAMES = ('Z', 'X')
+
+# Precomputed 1/√2 amplitude for the X-basis states, so state-vector
+# lookups don't redo the same exponentiation on every call
+_INV_SQRT2 = 1.0 / (2 ** 0.5)
+
+# Module-level generator shared by measurement and batch creation:
+# PCG64 draws are cheaper per call than the random module and support
+# the bulk draws the batched paths use. Not thread-safe, which is fine
+# for the single-process protocol runs and tests this backs.
+_rng = np.random.default_rng()
+
 
 class Qubit:
     """
@@ -25,6 +39,10 @@ class Qubit:
         state (str): String representation of the quantum state
     """
     
+    # Batches allocate many of these; slots drop the per-instance
+    # __dict__ and give C-level attribute access
+    __slots__ = ('basis', 'bit_value', 'state')
+    
     def __init__(self, basis: BasisType, bit_value: int):
         """
         Initialize a qubit with a specific basis and bit value.
@@ -92,7 +110,60 @@ class Qubit:
             # Wrong basis: random result (quantum uncertainty!)
             # Measuring |0⟩ in X-basis → 50% get 0, 50% get 1
             # Measuring |+⟩ in Z-basis → 50% get 0, 50% get 1
-            return random.choice([0, 1])
+            return int(_rng.integers(0, 2))
+    
+    def measure_many(self, measurement_basis: BasisType, shots: int) -> list[int]:
+        """
+        Measure the qubit repeatedly in one vectorized pass.
+        
+        A matching basis is deterministic, so the stored bit is simply
+        repeated; a mismatched basis samples all outcomes with a single
+        bulk RNG draw instead of `shots` Python-level measure() calls.
+        
+        Args:
+            measurement_basis: The basis to measure in ('Z' or 'X')
+            shots: Number of measurements to take
+            
+        Returns:
+            List of `shots` measurement outcomes (0s and 1s)
+            
+        Raises:
+            ValueError: If measurement_basis is not 'Z' or 'X'
+        """
+        if measurement_basis not in ['Z', 'X']:
+            raise ValueError(f"Measurement basis must be 'Z' or 'X', got '{measurement_basis}'")
+        
+        if measurement_basis == self.basis:
+            return [self.bit_value] * shots
+        
+        return _rng.integers(0, 2, shots).tolist()
+    
+    def measure_count_ones(self, measurement_basis: BasisType, shots: int) -> int:
+        """
+        Count the 1-outcomes of repeated measurements without
+        materializing them.
+        
+        For callers that only want the tally, this skips building a
+        shots-long list: a matching basis contributes the stored bit
+        deterministically, a mismatched one is a single binomial draw.
+        
+        Args:
+            measurement_basis: The basis to measure in ('Z' or 'X')
+            shots: Number of measurements to take
+            
+        Returns:
+            Number of measurements that returned 1
+            
+        Raises:
+            ValueError: If measurement_basis is not 'Z' or 'X'
+        """
+        if measurement_basis not in ['Z', 'X']:
+            raise ValueError(f"Measurement basis must be 'Z' or 'X', got '{measurement_basis}'")
+        
+        if measurement_basis == self.basis:
+            return shots * self.bit_value
+        
+        return int(_rng.binomial(shots, 0.5))
     
     def get_state_vector(self) -> tuple:
         """
@@ -117,11 +188,10 @@ class Qubit:
             else:
                 return (0.0, 1.0)  # |1⟩
         else:  # X-basis
-            sqrt_2_inv = 1.0 / (2 ** 0.5)  # 1/√2
             if self.bit_value == 0:
-                return (sqrt_2_inv, sqrt_2_inv)  # |+⟩
+                return (_INV_SQRT2, _INV_SQRT2)  # |+⟩
             else:
-                return (sqrt_2_inv, -sqrt_2_inv)  # |−⟩
+                return (_INV_SQRT2, -_INV_SQRT2)  # |−⟩
     
     def __repr__(self) -> str:
         """
@@ -142,6 +212,59 @@ class Qubit:
         return self.state
 
 
+class QubitBatch:
+    """
+    Structure-of-arrays container for a batch of random qubits.
+
+    Instead of one Qubit object per position (~dict + PyObject overhead
+    each), the batch carries two contiguous np.uint8 arrays: basis codes
+    (0='Z', 1='X') and bit values. Array consumers - the eavesdropper's
+    vectorized intercept path, the protocol kernels - read the codes
+    directly, while iteration and indexing materialize Qubit objects
+    lazily so existing per-qubit callers keep working.
+
+    Attributes:
+        bases (np.ndarray): Basis codes as uint8 (0='Z', 1='X')
+        bits (np.ndarray): Bit values as uint8 (0 or 1)
+    """
+
+    def __init__(self, bases: np.ndarray, bits: np.ndarray):
+        """
+        Wrap preexisting basis-code and bit arrays.
+
+        Args:
+            bases: Basis codes (0='Z', 1='X') as a uint8 array
+            bits: Bit values (0 or 1) as a uint8 array
+        """
+        self.bases = bases
+        self.bits = bits
+
+    def __len__(self) -> int:
+        """Number of qubits in the batch."""
+        return len(self.bits)
+
+    def __getitem__(self, index) -> Union[Qubit, 'QubitBatch']:
+        """
+        Materialize the qubit at `index` (or a sub-batch for slices).
+
+        Returns:
+            A Qubit built from the stored basis/bit codes, or a
+            QubitBatch view for slice indices
+        """
+        if isinstance(index, slice):
+            return QubitBatch(self.bases[index], self.bits[index])
+        return Qubit(_BASIS_NAMES[self.bases[index]], int(self.bits[index]))
+
+    def __iter__(self) -> Iterator[Qubit]:
+        """Yield Qubit objects built lazily from the stored codes."""
+        for basis, bit in zip(self.bases.tolist(), self.bits.tolist()):
+            yield Qubit(_BASIS_NAMES[basis], bit)
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"QubitBatch(count={len(self.bits)})"
+
+
 # Utility functions for qubit operations
 def create_random_qubit() -> Qubit:
     """
@@ -152,42 +275,68 @@ def create_random_qubit() -> Qubit:
     Returns:
         Qubit with random basis ('Z' or 'X') and random bit (0 or 1)
     """
-    basis = random.choice(['Z', 'X'])
-    bit_value = random.choice([0, 1])
+    basis = 'X' if _rng.integers(0, 2) else 'Z'
+    bit_value = int(_rng.integers(0, 2))
     return Qubit(basis, bit_value)
 
 
-def create_qubit_batch(count: int) -> list[Qubit]:
+def create_qubit_batch(count: int) -> QubitBatch:
     """
     Create multiple random qubits.
     
+    The batch is generated as two bulk RNG draws into a structure-of-
+    arrays QubitBatch rather than `count` individual Qubit objects;
+    per-qubit views are materialized on demand.
+    
     Args:
         count: Number of qubits to create
         
     Returns:
-        List of randomly generated qubits
+        QubitBatch of randomly generated qubits
     """
-    return [create_random_qubit() for _ in range(count)]
+    return QubitBatch(
+        bases=_rng.integers(0, 2, count, dtype=np.uint8),
+        bits=_rng.integers(0, 2, count, dtype=np.uint8),
+    )
 
 
-def measure_qubit_batch(qubits: list[Qubit], bases: list[BasisType]) -> list[int]:
+def measure_qubit_batch(qubits, bases: list[BasisType]) -> list[int]:
     """
     Measure a batch of qubits with specified bases.
     
+    The measurement law is applied to the whole batch at once: matching
+    bases keep the stored bit, mismatched ones take a random outcome
+    drawn in a single vectorized pass - no per-qubit measure() call.
+    
     Args:
-        qubits: List of qubits to measure
+        qubits: Qubits to measure (list of Qubit or QubitBatch)
         bases: List of measurement bases (one for each qubit)
         
     Returns:
         List of measurement outcomes (0s and 1s)
         
     Raises:
-        ValueError: If lengths don't match
+        ValueError: If lengths don't match or a basis is invalid
     """
     if len(qubits) != len(bases):
         raise ValueError(f"Number of qubits ({len(qubits)}) must match number of bases ({len(bases)})")
     
-    return [qubit.measure(basis) for qubit, basis in zip(qubits, bases)]
+    for basis in bases:
+        if basis not in ['Z', 'X']:
+            raise ValueError(f"Measurement basis must be 'Z' or 'X', got '{basis}'")
+    
+    n = len(bases)
+    if isinstance(qubits, QubitBatch):
+        # Basis codes already use the same 0='Z'/1='X' encoding
+        prep = qubits.bases
+        bits = qubits.bits
+    else:
+        prep = np.fromiter((qubit.basis == 'X' for qubit in qubits), dtype=np.uint8, count=n)
+        bits = np.fromiter((qubit.bit_value for qubit in qubits), dtype=np.uint8, count=n)
+    meas = np.fromiter((basis == 'X' for basis in bases), dtype=np.uint8, count=n)
+    
+    rand = _rng.integers(0, 2, n, dtype=np.uint8)
+    return np.where(prep == meas, bits, rand).tolist()
 
 
 # Quick demo for manual testing
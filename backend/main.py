@@ -4,15 +4,48 @@ FastAPI application entry point for BB84 QKD System.
 Main application that serves the BB84 quantum key distribution API.
 """
 
+from contextlib import asynccontextmanager
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 import uvicorn
 
+from api import routes
 from api.routes import router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown lifecycle."""
+    # Expose the worker pool that runs CPU-bound protocol executions so
+    # handlers and tests can reach it through the app
+    app.state.executor = routes._executor
+    print("=" * 70)
+    print("🔐 BB84 Quantum Key Distribution API")
+    print("=" * 70)
+    print("✅ Core components initialized")
+    print("✅ API routes registered")
+    print("✅ CORS configured")
+    print("\n📚 Documentation available at:")
+    print("   • Interactive: http://localhost:8000/docs")
+    print("   • Alternative: http://localhost:8000/redoc")
+    print("\n🔍 Health check: http://localhost:8000/api/health")
+    print("\n🚀 Ready to distribute quantum keys!")
+    print("=" * 70)
+    
+    yield
+    
+    routes._executor.shutdown(wait=False, cancel_futures=True)
+    print("\n" + "=" * 70)
+    print("🛑 Shutting down BB84 API...")
+    print("=" * 70)
+
+
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="BB84 Quantum Key Distribution API",
     description="""
     Complete implementation of the BB84 Quantum Key Distribution protocol.
@@ -75,39 +108,20 @@ async def root():
     return RedirectResponse(url="/docs")
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    print("=" * 70)
-    print("🔐 BB84 Quantum Key Distribution API")
-    print("=" * 70)
-    print("✅ Core components initialized")
-    print("✅ API routes registered")
-    print("✅ CORS configured")
-    print("\n📚 Documentation available at:")
-    print("   • Interactive: http://localhost:8000/docs")
-    print("   • Alternative: http://localhost:8000/redoc")
-    print("\n🔍 Health check: http://localhost:8000/api/health")
-    print("\n🚀 Ready to distribute quantum keys!")
-    print("=" * 70)
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    print("\n" + "=" * 70)
-    print("🛑 Shutting down BB84 API...")
-    print("=" * 70)
-
-
 # Run with uvicorn
 if __name__ == "__main__":
+    # uvloop + httptools roughly double event-loop throughput over the
+    # asyncio defaults; one worker process per core shares the listening
+    # socket. Set BB84_RELOAD=1 for single-process auto-reload instead
+    # (reload and multiple workers are mutually exclusive).
+    reload = os.environ.get("BB84_RELOAD") == "1"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=1 if reload else os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Unit tests for the custom BB84 protocol implementation.
+
+Covers the batch/throughput entry points: execute_fast, execute_batch
+and the trace-free run_bb84_counts sweep helper.
+"""
+
+import numpy as np
+import pytest
+
+from core.bb84 import BB84Protocol, run_bb84_counts
+
+
+class TestExecuteFast:
+    """Test the key-only execute_fast entry point."""
+
+    def test_generates_key_of_requested_length(self):
+        """Test that execute_fast produces a key capped at key_length."""
+        error_rate, is_secure, final_key = BB84Protocol(key_length=64).execute_fast()
+
+        assert 0 < len(final_key) <= 64
+        assert all(bit in [0, 1] for bit in final_key.tolist())
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test that the same seed reproduces a run exactly."""
+        result1 = BB84Protocol(key_length=64, seed=7).execute_fast()
+        result2 = BB84Protocol(key_length=64, seed=7).execute_fast()
+
+        assert result1[0] == result2[0]
+        assert result1[1] == result2[1]
+        assert np.array_equal(result1[2], result2[2])
+
+    def test_different_seeds_differ(self):
+        """Test that different seeds produce different keys."""
+        _, _, key1 = BB84Protocol(key_length=64, seed=7).execute_fast()
+        _, _, key2 = BB84Protocol(key_length=64, seed=8).execute_fast()
+
+        assert not np.array_equal(key1, key2)
+
+    def test_full_interception_is_detected(self):
+        """Test that a full intercept-resend attack raises the QBER past the threshold."""
+        error_rate, is_secure, _ = BB84Protocol(key_length=256, seed=7).execute_fast(
+            with_eavesdropper=True,
+            eavesdropper_intercept_rate=1.0
+        )
+
+        assert error_rate > 0.11
+        assert is_secure is False
+
+    def test_empty_sifted_set_degrades_gracefully(self):
+        """Test that runs too small to sift anything return an empty key, not an error."""
+        for seed in range(50):
+            protocol = BB84Protocol(key_length=1, transmission_multiplier=2, seed=seed)
+            error_rate, is_secure, final_key = protocol.execute_fast()
+
+            assert 0.0 <= error_rate <= 1.0
+            assert len(final_key) <= 1
+
+
+class TestExecuteBatch:
+    """Test concurrent batch execution."""
+
+    def test_results_follow_scenario_order(self):
+        """Test that each scenario yields one result, in order."""
+        protocol = BB84Protocol(key_length=32)
+        scenarios = [(False, 0.0), (True, 1.0), (False, 0.0)]
+        results = protocol.execute_batch(scenarios)
+
+        assert len(results) == 3
+        assert [r.eavesdropper_present for r in results] == [False, True, False]
+
+    def test_seeded_batches_are_reproducible(self):
+        """Test that a seeded parent produces identical batches."""
+        scenarios = [(False, 0.0), (True, 0.5)]
+        results1 = BB84Protocol(key_length=32, seed=7).execute_batch(scenarios)
+        results2 = BB84Protocol(key_length=32, seed=7).execute_batch(scenarios)
+
+        for r1, r2 in zip(results1, results2):
+            assert np.array_equal(r1.final_key, r2.final_key)
+            assert r1.error_rate == r2.error_rate
+
+
+class TestRunBB84Counts:
+    """Test the trace-free counts helper."""
+
+    def test_counts_are_consistent(self):
+        """Test that the returned counts respect their containment order."""
+        rng = np.random.default_rng(7)
+        errors, sample_size, sifted_len = run_bb84_counts(1024, intercept_rate=0.5, rng=rng)
+
+        assert 0 <= errors <= sample_size <= sifted_len <= 1024
+
+    def test_no_interception_means_no_errors(self):
+        """Test that a clean channel produces an error-free sample."""
+        rng = np.random.default_rng(7)
+        errors, sample_size, sifted_len = run_bb84_counts(1024, intercept_rate=0.0, rng=rng)
+
+        assert errors == 0
+        assert sample_size > 0
+
+    def test_sifting_keeps_about_half(self):
+        """Test that sifting keeps roughly 50% of the transmitted qubits."""
+        rng = np.random.default_rng(7)
+        _, _, sifted_len = run_bb84_counts(4096, rng=rng)
+
+        assert 0.3 * 4096 <= sifted_len <= 0.7 * 4096
+
+    def test_empty_transmission(self):
+        """Test that a zero-qubit run returns all-zero counts."""
+        assert run_bb84_counts(0) == (0, 0, 0)
+
+
+# Run tests
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -4,6 +4,7 @@ Unit tests for the Eavesdropper class in BB84 protocol.
 Tests interception behavior, QBER calculations, and attack strategies.
 """
 
+import numpy as np
 import pytest
 from core.qubit import Qubit, create_qubit_batch
 from core.eavesdropper import Eavesdropper, calculate_expected_qber, simulate_interception
@@ -113,8 +114,9 @@ class TestFullInterception:
         qubits = create_qubit_batch(100)
         eve.intercept(qubits)
         
-        z_count = sum(1 for b in eve.eve_bases if b == 'Z')
-        x_count = sum(1 for b in eve.eve_bases if b == 'X')
+        bases = np.asarray(eve.eve_bases)
+        z_count = int(np.count_nonzero(bases == 'Z'))
+        x_count = int(np.count_nonzero(bases == 'X'))
         
         # Should have both bases (statistically)
         assert z_count > 0
@@ -127,8 +129,8 @@ class TestFullInterception:
         qubits = create_qubit_batch(100)
         eve.intercept(qubits)
         
-        zeros = sum(1 for b in eve.eve_bits if b == 0)
-        ones = sum(1 for b in eve.eve_bits if b == 1)
+        bit_counts = np.bincount(np.asarray(eve.eve_bits, dtype=np.uint8), minlength=2)
+        zeros, ones = int(bit_counts[0]), int(bit_counts[1])
         
         # Should have both bit values (statistically)
         assert zeros > 0
@@ -141,25 +143,27 @@ class TestPartialInterception:
     
     def test_partial_interception_rate(self):
         """Test that intercept rate approximately matches expected value."""
-        eve = Eavesdropper(intercept_probability=0.5)
-        qubits = create_qubit_batch(1000)
+        eve = Eavesdropper(intercept_probability=0.5, seed=42)
+        qubits = create_qubit_batch(200)
         eve.intercept(qubits)
         
-        # Should intercept roughly 50% (with statistical tolerance)
-        assert 400 <= eve.intercepted_count <= 600
+        # Seeded run, so a tight 3-sigma binomial bound is deterministic
+        tolerance = 3 * (200 * 0.5 * 0.5) ** 0.5
+        assert abs(eve.intercepted_count - 100) <= tolerance
     
     def test_different_intercept_rates(self):
         """Test various intercept rates work correctly."""
         rates = [0.1, 0.3, 0.7, 0.9]
         
         for rate in rates:
-            eve = Eavesdropper(intercept_probability=rate)
-            qubits = create_qubit_batch(1000)
+            eve = Eavesdropper(intercept_probability=rate, seed=42)
+            qubits = create_qubit_batch(200)
             eve.intercept(qubits)
             
-            expected = rate * 1000
-            # Generous tolerance for randomness
-            assert expected - 100 <= eve.intercepted_count <= expected + 100
+            expected = rate * 200
+            # Seeded run, so a tight 3-sigma binomial bound is deterministic
+            tolerance = 3 * (200 * rate * (1 - rate)) ** 0.5
+            assert abs(eve.intercepted_count - expected) <= tolerance
 
 
 class TestInterceptResendAttack:
@@ -330,7 +334,9 @@ class TestSimulateInterception:
         qubits = create_qubit_batch(20)
         result, eve = simulate_interception(qubits, intercept_rate=0.5)
         
-        assert isinstance(result, list)
+        # A QubitBatch comes back for batch input; either way the result
+        # behaves like a sequence of qubits
+        assert hasattr(result, '__len__') and hasattr(result, '__getitem__')
         assert isinstance(eve, Eavesdropper)
     
     def test_simulate_interception_correct_length(self):
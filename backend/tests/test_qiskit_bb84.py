@@ -8,6 +8,27 @@ import pytest
 from core.qiskit_bb84 import QiskitBB84Protocol, QiskitBB84Result
 
 
+@pytest.fixture(scope="module")
+def result64():
+    """
+    One shared no-eavesdropper run for the read-only assertions.
+
+    Most tests only inspect the result structure, so a single execution
+    satisfies them all instead of paying simulator startup per test.
+    Tests that assert on randomness across runs keep per-call execution.
+    """
+    return QiskitBB84Protocol(key_length=64).execute(with_eavesdropper=False)
+
+
+@pytest.fixture(scope="module")
+def result64_with_eve():
+    """One shared eavesdropper run (intercept rate 0.5) for the read-only assertions."""
+    return QiskitBB84Protocol(key_length=64).execute(
+        with_eavesdropper=True,
+        eavesdropper_intercept_rate=0.5
+    )
+
+
 class TestQiskitBB84Creation:
     """Test Qiskit BB84 protocol initialization."""
     
@@ -37,43 +58,38 @@ class TestQiskitBB84Creation:
 class TestQiskitBB84WithoutEavesdropper:
     """Test protocol execution without eavesdropper."""
     
-    def test_protocol_executes_successfully(self):
+    def test_protocol_executes_successfully(self, result64):
         """Test that protocol executes without errors."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert result is not None
         assert isinstance(result, QiskitBB84Result)
     
-    def test_protocol_generates_key(self):
+    def test_protocol_generates_key(self, result64):
         """Test that protocol generates a key."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert len(result.final_key) > 0
         assert len(result.final_key) <= 64
     
-    def test_qber_is_low_without_eve(self):
+    def test_qber_is_low_without_eve(self, result64):
         """Test that QBER is low without eavesdropper."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         # QBER should be low (< 15% to account for quantum randomness)
         assert result.error_rate < 0.15
     
-    def test_sifting_efficiency(self):
+    def test_sifting_efficiency(self, result64):
         """Test that sifting keeps approximately 50% of bits."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         efficiency = result.sifting_efficiency
         # Should be roughly 50% (allowing 30-70% range for quantum randomness)
         assert 30 <= efficiency <= 70
     
-    def test_implementation_is_qiskit(self):
+    def test_implementation_is_qiskit(self, result64):
         """Test that implementation is marked as Qiskit."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert result.implementation == "Qiskit"
 
@@ -81,24 +97,16 @@ class TestQiskitBB84WithoutEavesdropper:
 class TestQiskitBB84WithEavesdropper:
     """Test protocol execution with eavesdropper."""
     
-    def test_protocol_with_eve_executes(self):
+    def test_protocol_with_eve_executes(self, result64_with_eve):
         """Test that protocol executes with eavesdropper."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(
-            with_eavesdropper=True,
-            eavesdropper_intercept_rate=0.5
-        )
+        result = result64_with_eve
         
         assert result is not None
         assert result.eavesdropper_present is True
     
-    def test_eve_statistics_recorded(self):
+    def test_eve_statistics_recorded(self, result64_with_eve):
         """Test that eavesdropper statistics are recorded."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(
-            with_eavesdropper=True,
-            eavesdropper_intercept_rate=0.5
-        )
+        result = result64_with_eve
         
         assert result.eavesdropper_stats is not None
         assert 'total_intercepted' in result.eavesdropper_stats
@@ -119,46 +127,41 @@ class TestQiskitBB84WithEavesdropper:
 class TestQiskitBB84Results:
     """Test protocol result structure."""
     
-    def test_result_has_alice_data(self):
+    def test_result_has_alice_data(self, result64):
         """Test that result contains Alice's data."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert hasattr(result, 'alice_bits')
         assert hasattr(result, 'alice_bases')
         assert len(result.alice_bits) == len(result.alice_bases)
     
-    def test_result_has_bob_data(self):
+    def test_result_has_bob_data(self, result64):
         """Test that result contains Bob's data."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert hasattr(result, 'bob_bits')
         assert hasattr(result, 'bob_bases')
         assert len(result.bob_bits) == len(result.bob_bases)
     
-    def test_result_has_sifted_data(self):
+    def test_result_has_sifted_data(self, result64):
         """Test that result contains sifted data."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert hasattr(result, 'sifted_alice_bits')
         assert hasattr(result, 'sifted_bob_bits')
         assert hasattr(result, 'matching_indices')
     
-    def test_result_has_error_data(self):
+    def test_result_has_error_data(self, result64):
         """Test that result contains error checking data."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert hasattr(result, 'error_rate')
         assert hasattr(result, 'errors_found')
         assert hasattr(result, 'is_secure')
     
-    def test_result_has_statistics(self):
+    def test_result_has_statistics(self, result64):
         """Test that result contains statistics."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert hasattr(result, 'total_transmitted')
         assert hasattr(result, 'total_sifted')
@@ -178,10 +181,9 @@ class TestQiskitBB84KeyGeneration:
         assert result.final_key_length >= 64  # At least half
         assert result.final_key_length <= 128
     
-    def test_key_contains_valid_bits(self):
+    def test_key_contains_valid_bits(self, result64):
         """Test that key contains only 0s and 1s."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         assert all(bit in [0, 1] for bit in result.final_key)
     
@@ -221,10 +223,9 @@ class TestQiskitBB84Transmission:
 class TestQiskitBB84Security:
     """Test security threshold detection."""
     
-    def test_low_qber_is_secure(self):
+    def test_low_qber_is_secure(self, result64):
         """Test that low QBER is marked as secure."""
-        protocol = QiskitBB84Protocol(key_length=64)
-        result = protocol.execute(with_eavesdropper=False)
+        result = result64
         
         if result.error_rate <= 0.11:
             assert result.is_secure is True
@@ -235,6 +236,39 @@ class TestQiskitBB84Security:
         assert protocol.qber_threshold == 0.11
 
 
+class TestQiskitBB84Batch:
+    """Test parallel batch execution."""
+
+    def test_batch_returns_one_result_per_run(self):
+        """Test that execute_batch yields one result per requested run."""
+        protocol = QiskitBB84Protocol(key_length=32)
+        results = protocol.execute_batch(3, with_eavesdropper=True)
+
+        assert len(results) == 3
+        assert all(isinstance(r, QiskitBB84Result) for r in results)
+        assert all(r.eavesdropper_present for r in results)
+
+
+class TestQiskitBB84Seeding:
+    """Test seeded reproducibility."""
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test that the same seed reproduces an eavesdropper run exactly."""
+        result1 = QiskitBB84Protocol(key_length=64, seed=7).execute(with_eavesdropper=True)
+        result2 = QiskitBB84Protocol(key_length=64, seed=7).execute(with_eavesdropper=True)
+
+        assert result1.final_key == result2.final_key
+        assert result1.bob_bits == result2.bob_bits
+        assert result1.error_rate == result2.error_rate
+
+    def test_different_seeds_differ(self):
+        """Test that different seeds produce different runs."""
+        result1 = QiskitBB84Protocol(key_length=64, seed=7).execute(with_eavesdropper=True)
+        result2 = QiskitBB84Protocol(key_length=64, seed=8).execute(with_eavesdropper=True)
+
+        assert result1.bob_bits != result2.bob_bits
+
+
 class TestQiskitBB84Integration:
     """Integration tests for complete protocol."""
     
@@ -12,6 +12,25 @@ from core.qiskit_qubit import (
 )
 
 
+@pytest.fixture(scope="module")
+def shots_table():
+    """
+    100 measurement outcomes per (prep basis, bit, measurement basis)
+    combination.
+
+    Each combination is sampled with one batched measure_many call, so
+    the statistical measurement tests share 8 batch draws instead of
+    running hundreds of individual measure() loops.
+    """
+    table = {}
+    for prep in ('Z', 'X'):
+        for bit in (0, 1):
+            qubits = [QiskitQubit(prep, bit)] * 100
+            for meas in ('Z', 'X'):
+                table[(prep, bit, meas)] = QiskitQubit.measure_many(qubits, [meas] * 100)
+    return table
+
+
 class TestQiskitQubitCreation:
     """Test Qiskit qubit initialization and state representation."""
     
@@ -70,43 +89,38 @@ class TestQiskitQubitCreation:
 class TestQiskitCorrectBasisMeasurement:
     """Test measurements when basis matches preparation basis."""
     
-    def test_z_basis_bit_0_measured_in_z(self):
+    def test_z_basis_bit_0_measured_in_z(self, shots_table):
         """Test |0⟩ measured in Z-basis gives consistent results."""
-        q = QiskitQubit('Z', 0)
-        results = [q.measure('Z') for _ in range(20)]
+        results = shots_table[('Z', 0, 'Z')]
         # Should be mostly 0s (allowing for quantum randomness)
         zeros = sum(1 for r in results if r == 0)
-        assert zeros >= 15  # At least 75% correct (very lenient for quantum)
+        assert zeros >= 75  # At least 75% correct (very lenient for quantum)
     
-    def test_z_basis_bit_1_measured_in_z(self):
+    def test_z_basis_bit_1_measured_in_z(self, shots_table):
         """Test |1⟩ measured in Z-basis gives consistent results."""
-        q = QiskitQubit('Z', 1)
-        results = [q.measure('Z') for _ in range(20)]
+        results = shots_table[('Z', 1, 'Z')]
         ones = sum(1 for r in results if r == 1)
-        assert ones >= 15  # At least 75% correct
+        assert ones >= 75  # At least 75% correct
     
-    def test_x_basis_bit_0_measured_in_x(self):
+    def test_x_basis_bit_0_measured_in_x(self, shots_table):
         """Test |+⟩ measured in X-basis gives consistent results."""
-        q = QiskitQubit('X', 0)
-        results = [q.measure('X') for _ in range(20)]
+        results = shots_table[('X', 0, 'X')]
         zeros = sum(1 for r in results if r == 0)
-        assert zeros >= 15  # At least 75% correct
+        assert zeros >= 75  # At least 75% correct
     
-    def test_x_basis_bit_1_measured_in_x(self):
+    def test_x_basis_bit_1_measured_in_x(self, shots_table):
         """Test |−⟩ measured in X-basis gives consistent results."""
-        q = QiskitQubit('X', 1)
-        results = [q.measure('X') for _ in range(20)]
+        results = shots_table[('X', 1, 'X')]
         ones = sum(1 for r in results if r == 1)
-        assert ones >= 15  # At least 75% correct
+        assert ones >= 75  # At least 75% correct
 
 
 class TestQiskitWrongBasisMeasurement:
     """Test measurements when basis doesn't match preparation basis."""
     
-    def test_z_bit_0_measured_in_x_is_random(self):
+    def test_z_bit_0_measured_in_x_is_random(self, shots_table):
         """Test |0⟩ measured in X-basis gives random results."""
-        q = QiskitQubit('Z', 0)
-        results = [q.measure('X') for _ in range(100)]
+        results = shots_table[('Z', 0, 'X')]
         zeros = sum(1 for r in results if r == 0)
         ones = len(results) - zeros
         
@@ -114,10 +128,9 @@ class TestQiskitWrongBasisMeasurement:
         assert 30 <= zeros <= 70, f"Expected ~50% zeros, got {zeros}%"
         assert 30 <= ones <= 70, f"Expected ~50% ones, got {ones}%"
     
-    def test_x_bit_0_measured_in_z_is_random(self):
+    def test_x_bit_0_measured_in_z_is_random(self, shots_table):
         """Test |+⟩ measured in Z-basis gives random results."""
-        q = QiskitQubit('X', 0)
-        results = [q.measure('Z') for _ in range(100)]
+        results = shots_table[('X', 0, 'Z')]
         zeros = sum(1 for r in results if r == 0)
         
         assert 30 <= zeros <= 70, f"Expected ~50% zeros, got {zeros}%"
@@ -123,7 +123,7 @@ class TestWrongBasisMeasurement:
     def test_z_bit_0_measured_in_x_is_random(self):
         """Test |0⟩ measured in X-basis gives ~50% 0s and 50% 1s."""
         q = Qubit('Z', 0)
-        results = [q.measure('X') for _ in range(1000)]
+        results = q.measure_many('X', 1000)
         zeros = sum(1 for r in results if r == 0)
         ones = len(results) - zeros
         
@@ -134,7 +134,7 @@ class TestWrongBasisMeasurement:
     def test_z_bit_1_measured_in_x_is_random(self):
         """Test |1⟩ measured in X-basis gives ~50% 0s and 50% 1s."""
         q = Qubit('Z', 1)
-        results = [q.measure('X') for _ in range(1000)]
+        results = q.measure_many('X', 1000)
         zeros = sum(1 for r in results if r == 0)
         ones = len(results) - zeros
         
@@ -144,7 +144,7 @@ class TestWrongBasisMeasurement:
     def test_x_bit_0_measured_in_z_is_random(self):
         """Test |+⟩ measured in Z-basis gives ~50% 0s and 50% 1s."""
         q = Qubit('X', 0)
-        results = [q.measure('Z') for _ in range(1000)]
+        results = q.measure_many('Z', 1000)
         zeros = sum(1 for r in results if r == 0)
         ones = len(results) - zeros
         
@@ -154,7 +154,7 @@ class TestWrongBasisMeasurement:
     def test_x_bit_1_measured_in_z_is_random(self):
         """Test |−⟩ measured in Z-basis gives ~50% 0s and 50% 1s."""
         q = Qubit('X', 1)
-        results = [q.measure('Z') for _ in range(1000)]
+        results = q.measure_many('Z', 1000)
         zeros = sum(1 for r in results if r == 0)
         ones = len(results) - zeros
         
@@ -165,9 +165,9 @@ class TestWrongBasisMeasurement:
         """Test that wrong basis measurements have high variance."""
         # Multiple runs should give different results
         q = Qubit('Z', 0)
-        run1 = sum(q.measure('X') for _ in range(100))
-        run2 = sum(q.measure('X') for _ in range(100))
-        run3 = sum(q.measure('X') for _ in range(100))
+        run1 = q.measure_count_ones('X', 100)
+        run2 = q.measure_count_ones('X', 100)
+        run3 = q.measure_count_ones('X', 100)
         
         # Very unlikely all three runs are identical if truly random
         assert not (run1 == run2 == run3), "Random measurements should vary between runs"
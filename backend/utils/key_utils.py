@@ -6,8 +6,27 @@ Provides conversion functions between different key representations
 """
 
 import base64
+import re
 from typing import List
 
+import numpy as np
+
+# Deletes '0' and '1' - any residue after translating a bit string
+# through this table is an invalid character
+_STRIP_01 = str.maketrans('', '', '01')
+
+# Compiled grouping patterns for format_key_display, keyed by group
+# size - only a handful of sizes ever occur
+_GROUP_PATTERNS: dict = {}
+
+
+def _group_pattern(group_size: int) -> 're.Pattern':
+    """Return the cached regex matching one full display group."""
+    pattern = _GROUP_PATTERNS.get(group_size)
+    if pattern is None:
+        pattern = _GROUP_PATTERNS[group_size] = re.compile(f'(.{{{group_size}}})')
+    return pattern
+
 
 def bits_to_hex(bits: List[int]) -> str:
     """
@@ -23,24 +42,13 @@ def bits_to_hex(bits: List[int]) -> str:
         >>> bits_to_hex([1, 0, 1, 0, 1, 1, 0, 1])
         'AD'
     """
-    if not bits:
+    if len(bits) == 0:
         return ""
     
-    hex_string = ""
-    
-    # Process in chunks of 4 bits
-    for i in range(0, len(bits), 4):
-        chunk = bits[i:i+4]
-        
-        # Pad last chunk if necessary
-        while len(chunk) < 4:
-            chunk.append(0)
-        
-        # Convert to hex digit (0-15)
-        value = chunk[0] * 8 + chunk[1] * 4 + chunk[2] * 2 + chunk[3]
-        hex_string += format(value, 'X')
-    
-    return hex_string
+    # packbits zero-pads to whole bytes; one hex digit is emitted per
+    # 4-bit chunk of input, so trim the trailing pad digit if any
+    n_digits = -(-len(bits) // 4)
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes().hex().upper()[:n_digits]
 
 
 def hex_to_bits(hex_string: str) -> List[int]:
@@ -57,17 +65,14 @@ def hex_to_bits(hex_string: str) -> List[int]:
         >>> hex_to_bits('AD')
         [1, 0, 1, 0, 1, 1, 0, 1]
     """
-    bits = []
-    
-    for hex_char in hex_string:
-        # Convert hex character to integer
-        value = int(hex_char, 16)
-        
-        # Convert to 4 bits
-        for i in range(3, -1, -1):
-            bits.append((value >> i) & 1)
-    
-    return bits
+    if not hex_string:
+        return []
+    
+    # bytes.fromhex needs whole bytes; pad odd-length input with a zero
+    # nibble and trim the extra bits after unpacking
+    padded = hex_string if len(hex_string) % 2 == 0 else hex_string + '0'
+    unpacked = np.unpackbits(np.frombuffer(bytes.fromhex(padded), dtype=np.uint8))
+    return unpacked[:4 * len(hex_string)].tolist()
 
 
 def bits_to_bytes(bits: List[int]) -> bytes:
@@ -80,24 +85,11 @@ def bits_to_bytes(bits: List[int]) -> bytes:
     Returns:
         Bytes object
     """
-    if not bits:
+    if len(bits) == 0:
         return b""
     
-    # Pad to multiple of 8
-    padded_bits = bits.copy()
-    while len(padded_bits) % 8 != 0:
-        padded_bits.append(0)
-    
-    byte_array = bytearray()
-    
-    # Process in chunks of 8 bits
-    for i in range(0, len(padded_bits), 8):
-        byte_value = 0
-        for j in range(8):
-            byte_value = (byte_value << 1) | padded_bits[i + j]
-        byte_array.append(byte_value)
-    
-    return bytes(byte_array)
+    # packbits zero-pads to a byte boundary, matching the old manual loop
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes()
 
 
 def bytes_to_bits(data: bytes) -> List[int]:
@@ -110,13 +102,7 @@ def bytes_to_bits(data: bytes) -> List[int]:
     Returns:
         List of 0s and 1s
     """
-    bits = []
-    
-    for byte in data:
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    
-    return bits
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8)).tolist()
 
 
 def bits_to_base64(bits: List[int]) -> str:
@@ -161,7 +147,11 @@ def bits_to_string(bits: List[int]) -> str:
         >>> bits_to_string([1, 0, 1, 1])
         '1011'
     """
-    return ''.join(str(bit) for bit in bits)
+    if len(bits) == 0:
+        return ""
+
+    # Single C-level add + copy instead of stringifying each bit in Python
+    return (np.asarray(bits, dtype=np.uint8) + ord('0')).tobytes().decode('ascii')
 
 
 def string_to_bits(bit_string: str) -> List[int]:
@@ -177,10 +167,13 @@ def string_to_bits(bit_string: str) -> List[int]:
     Raises:
         ValueError: If string contains non-binary characters
     """
-    if not all(c in '01' for c in bit_string):
+    # C-level validation and conversion: translate drops the valid
+    # characters (any residue is a bad one), then the digits decode as
+    # an ASCII buffer in a single vectorized subtraction
+    if bit_string.translate(_STRIP_01):
         raise ValueError("String must contain only 0s and 1s")
-    
-    return [int(c) for c in bit_string]
+
+    return (np.frombuffer(bit_string.encode('ascii'), dtype=np.uint8) - ord('0')).tolist()
 
 
 def calculate_hamming_distance(bits1: List[int], bits2: List[int]) -> int:
@@ -202,7 +195,10 @@ def calculate_hamming_distance(bits1: List[int], bits2: List[int]) -> int:
     if len(bits1) != len(bits2):
         raise ValueError(f"Bit sequences must have same length: {len(bits1)} vs {len(bits2)}")
     
-    return sum(b1 != b2 for b1, b2 in zip(bits1, bits2))
+    # One C-level XOR + popcount instead of a per-bit generator pass
+    return int(np.count_nonzero(
+        np.asarray(bits1, dtype=np.uint8) ^ np.asarray(bits2, dtype=np.uint8)
+    ))
 
 
 def calculate_hamming_weight(bits: List[int]) -> int:
@@ -215,7 +211,7 @@ def calculate_hamming_weight(bits: List[int]) -> int:
     Returns:
         Number of 1s in the sequence
     """
-    return sum(bits)
+    return int(np.count_nonzero(np.asarray(bits, dtype=np.uint8)))
 
 
 def xor_bits(bits1: List[int], bits2: List[int]) -> List[int]:
@@ -235,7 +231,7 @@ def xor_bits(bits1: List[int], bits2: List[int]) -> List[int]:
     if len(bits1) != len(bits2):
         raise ValueError(f"Bit sequences must have same length: {len(bits1)} vs {len(bits2)}")
     
-    return [b1 ^ b2 for b1, b2 in zip(bits1, bits2)]
+    return (np.asarray(bits1, dtype=np.uint8) ^ np.asarray(bits2, dtype=np.uint8)).tolist()
 
 
 def format_key_display(bits: List[int], format_type: str = "hex", group_size: int = 4) -> str:
@@ -265,11 +261,11 @@ def format_key_display(bits: List[int], format_type: str = "hex", group_size: in
     else:
         raise ValueError(f"Invalid format_type: {format_type}")
     
-    # Group characters for readability
+    # Group characters for readability - the regex inserts the spaces in
+    # one C-level pass instead of a Python slice per group
     if group_size > 0:
-        grouped = ' '.join(raw[i:i+group_size] for i in range(0, len(raw), group_size))
-        return grouped
-    
+        return _group_pattern(group_size).sub(r'\1 ', raw).rstrip()
+
     return raw
 
 
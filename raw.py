@@ -1,159 +1,328 @@
-import React, { useState } from 'react';
+import React, { useMemo, useRef, useState } from 'react';
 import { AlertCircle, Lock, Unlock, Radio, Shield, Zap } from 'lucide-react';
 
-// Quantum state representation
-class Qubit {
-  constructor(basis, bit) {
-    this.basis = basis; // 'rectilinear' (+) or 'diagonal' (x)
-    this.bit = bit;     // 0 or 1
-  }
-  
-  // Measure the qubit in a given basis
-  measure(measurementBasis) {
-    if (this.basis === measurementBasis) {
-      return this.bit; // Correct basis - get correct bit
-    } else {
-      return Math.random() < 0.5 ? 0 : 1; // Wrong basis - random result
-    }
+// All protocol code lives inside this factory so the exact same
+// implementation can run on the main thread and be serialized into
+// a Web Worker via toString() - the component stays a single file.
+function createBB84Module() {
+  // Basis codes: 0 = rectilinear (+), 1 = diagonal (x).
+  // Qubits live bit-packed in Uint32Array words - one array of bits and
+  // one of basis codes, 32 qubits per word (bit b of word w is qubit
+  // w*32+b) - so measurement and sifting run as whole-word mask ops
+  // instead of per-qubit branches.
+
+  // xorshift32 generator state - Math.random() computes a double we
+  // only ever strip bits from, so an integer xorshift (3 XORs + 2
+  // shifts per 32 bits) replaces it in the hot loops. Seedable so runs
+  // are reproducible when debugging.
+  let rngState = ((Date.now() * 2654435761) >>> 0) || 1;
+
+  function seedRng(seed) {
+    rngState = (seed >>> 0) || 1; // xorshift state must be nonzero
   }
-}
 
-// BB84 Protocol Implementation
-class BB84Protocol {
-  constructor(keyLength = 256) {
-    this.keyLength = keyLength;
-    this.transmissionMultiplier = 4; // Send 4x more bits than needed
+  // Draw 32 random bits
+  function randBits32() {
+    let x = rngState;
+    x ^= x << 13;
+    x ^= x >>> 17;
+    x ^= x << 5;
+    return (rngState = x >>> 0);
   }
-  
-  // Alice prepares qubits
-  alicePrepare() {
-    const n = this.keyLength * this.transmissionMultiplier;
-    const aliceBits = Array.from({ length: n }, () => Math.random() < 0.5 ? 0 : 1);
-    const aliceBases = Array.from({ length: n }, () => 
-      Math.random() < 0.5 ? 'rectilinear' : 'diagonal'
-    );
-    
-    const qubits = aliceBits.map((bit, i) => new Qubit(aliceBases[i], bit));
-    
-    return { aliceBits, aliceBases, qubits };
+
+  // 256-entry byte popcount table, built once at module setup
+  const POP = new Uint8Array(256);
+  for (let i = 0; i < 256; i++) {
+    let c = i;
+    let k = 0;
+    while (c) { c &= c - 1; k++; }
+    POP[i] = k;
   }
-  
-  // Bob measures qubits
-  bobMeasure(qubits) {
-    const n = qubits.length;
-    const bobBases = Array.from({ length: n }, () => 
-      Math.random() < 0.5 ? 'rectilinear' : 'diagonal'
-    );
-    const bobBits = qubits.map((qubit, i) => qubit.measure(bobBases[i]));
-    
-    return { bobBases, bobBits };
+
+  // Popcount of a 32-bit word via four byte lookups
+  function popcnt(x) {
+    return POP[x & 0xff] + POP[(x >>> 8) & 0xff] + POP[(x >>> 16) & 0xff] + POP[x >>> 24];
   }
+
+  // BB84 Protocol Implementation
+  class BB84Protocol {
+    constructor(keyLength = 256) {
+      this.keyLength = keyLength;
+      this.transmissionMultiplier = 4; // Send 4x more bits than needed
+      this.qubitCount = keyLength * this.transmissionMultiplier;
+      this.words = (this.qubitCount + 31) >>> 5;
+      this.debug = false; // opt in to raw per-qubit arrays in results
+      // Internal scratch reused across runs (the worker keeps one
+      // instance alive per key length); only arrays that never leave
+      // execute() live here - returned arrays stay per-run since their
+      // buffers are transferred to the UI thread
+      this.maskScratch = new Uint32Array(this.words);
+      this.eveBitsScratch = null;
+      this.eveBasesScratch = null;
+    }
   
-  // Sifting: Keep only bits where bases match
-  sift(aliceBits, aliceBases, bobBits, bobBases) {
-    const siftedAlice = [];
-    const siftedBob = [];
-    const matchingIndices = [];
-    
-    for (let i = 0; i < aliceBases.length; i++) {
-      if (aliceBases[i] === bobBases[i]) {
-        siftedAlice.push(aliceBits[i]);
-        siftedBob.push(bobBits[i]);
-        matchingIndices.push(i);
+    // Alice prepares qubits (bits + bases bit-packed, 32 per word)
+    alicePrepare() {
+      const words = this.words;
+      const aliceBits = new Uint32Array(words);
+      const aliceBases = new Uint32Array(words);
+      for (let w = 0; w < words; w++) {
+        aliceBits[w] = randBits32();
+        aliceBases[w] = randBits32();
       }
+
+      return { aliceBits, aliceBases };
     }
-    
-    return { siftedAlice, siftedBob, matchingIndices };
-  }
-  
-  // Error estimation: Check random subset for eavesdropping
-  estimateError(siftedAlice, siftedBob, sampleSize = 50) {
-    const n = Math.min(siftedAlice.length, sampleSize);
-    let errors = 0;
-    const checkedIndices = [];
-    
-    // Randomly sample indices
-    const availableIndices = [...Array(siftedAlice.length).keys()];
-    for (let i = 0; i < n; i++) {
-      const randomIndex = Math.floor(Math.random() * availableIndices.length);
-      const index = availableIndices.splice(randomIndex, 1)[0];
-      checkedIndices.push(index);
-      
-      if (siftedAlice[index] !== siftedBob[index]) {
-        errors++;
+
+    // Bob measures the transmitted qubits, one word (32 qubits) at a time:
+    // matching-basis lanes keep the transmitted bit, the rest collapse to
+    // fresh random bits - a branchless blend through the match mask
+    bobMeasure(transmittedBits, transmittedBases) {
+      const words = transmittedBits.length;
+      const bobBases = new Uint32Array(words);
+      const bobBits = new Uint32Array(words);
+      for (let w = 0; w < words; w++) {
+        const mBases = randBits32();
+        const match = ~(transmittedBases[w] ^ mBases) >>> 0;
+        bobBases[w] = mBases;
+        bobBits[w] = ((transmittedBits[w] & match) | (randBits32() & ~match)) >>> 0;
       }
+
+      return { bobBases, bobBits };
     }
-    
-    const errorRate = errors / n;
-    return { errorRate, errors, checkedIndices, sampleSize: n };
-  }
   
-  // Privacy amplification: Generate final key
-  privacyAmplification(siftedAlice, checkedIndices) {
-    // Remove checked bits
-    const finalKey = siftedAlice.filter((_, i) => !checkedIndices.includes(i));
-    
-    // Take only keyLength bits
-    return finalKey.slice(0, this.keyLength);
-  }
+    // Fused sifting, error estimation and key extraction. A popcount
+    // pass over the match masks sizes the sifted arrays exactly; the
+    // main pass unpacks matching bits once while reservoir-sampling
+    // (Algorithm R) the check positions, so the old three-method chain
+    // of separate traversals and intermediate allocations collapses
+    // into a single walk over the packed words.
+    // matchingIndices is only built when asked for - the protocol path
+    // never reads it, so by default those writes are skipped entirely
+    siftCheckAndExtract(aliceBits, aliceBases, bobBits, bobBases, sampleSize = 50, collectIndices = false) {
+      const words = aliceBases.length;
+      const n = this.qubitCount;
+
+      // Pass 1: match masks + exact sifted count (mask scratch is
+      // reused across runs)
+      const masks = this.maskScratch;
+      let total = 0;
+      for (let w = 0; w < words; w++) {
+        let match = ~(aliceBases[w] ^ bobBases[w]) >>> 0;
+        const tail = n - (w << 5);
+        if (tail < 32) match &= (1 << tail) - 1;
+        masks[w] = match;
+        total += popcnt(match);
+      }
+
+      const siftedAlice = new Uint8Array(total);
+      const siftedBob = new Uint8Array(total);
+      const matchingIndices = collectIndices ? new Uint32Array(total) : null;
+      const reservoir = new Uint32Array(Math.min(total, sampleSize));
+
+      // Pass 2: unpack matching bits and sample the check set inline
+      let seen = 0;
+      for (let w = 0; w < words; w++) {
+        const match = masks[w];
+        if (match === 0) continue;
+        const aW = aliceBits[w];
+        const bW = bobBits[w];
+        const base = w << 5;
+        for (let b = 0; b < 32; b++) {
+          if ((match >>> b) & 1) {
+            if (seen < sampleSize) {
+              reservoir[seen] = seen;
+            } else {
+              const j = randBits32() % (seen + 1);
+              if (j < sampleSize) reservoir[j] = seen;
+            }
+            siftedAlice[seen] = (aW >>> b) & 1;
+            siftedBob[seen] = (bW >>> b) & 1;
+            if (collectIndices) matchingIndices[seen] = base + b;
+            seen++;
+          }
+        }
+      }
+
+      // Error estimate over the sampled positions
+      const sampled = reservoir.length;
+      const drop = new Uint8Array(total);
+      let errors = 0;
+      for (let i = 0; i < sampled; i++) {
+        const pos = reservoir[i];
+        drop[pos] = 1;
+        if (siftedAlice[pos] !== siftedBob[pos]) errors++;
+      }
+
+      // Remaining sifted bits become the key, up to keyLength
+      const key = new Uint8Array(this.keyLength);
+      let k = 0;
+      for (let i = 0; i < total && k < this.keyLength; i++) {
+        if (!drop[i]) key[k++] = siftedAlice[i];
+      }
+      const finalKey = k === this.keyLength ? key : key.slice(0, k);
+
+      const errorCheck = {
+        errorRate: sampled > 0 ? errors / sampled : 0,
+        errors,
+        checkedIndices: Array.from(reservoir),
+        sampleSize: sampled,
+      };
+
+      return { siftedAlice, siftedBob, matchingIndices, errorCheck, finalKey };
+    }
   
-  // Simulate eavesdropper (Eve)
-  eveIntercept(qubits, interceptProbability = 0.5) {
-    return qubits.map(qubit => {
-      if (Math.random() < interceptProbability) {
-        // Eve intercepts and measures
-        const eveBasis = Math.random() < 0.5 ? 'rectilinear' : 'diagonal';
-        const measuredBit = qubit.measure(eveBasis);
-        // Eve sends a new qubit based on her measurement
-        return new Qubit(eveBasis, measuredBit);
+    // Simulate eavesdropper (Eve): build a per-word intercept mask, then
+    // measure and resend the intercepted lanes with branchless blends
+    eveIntercept(bits, bases, interceptProbability = 0.5) {
+      // Nothing is intercepted - the originals pass through untouched
+      if (interceptProbability <= 0) {
+        return { bits, bases };
       }
-      return qubit;
-    });
-  }
+
+      const words = bits.length;
+      const interceptAll = interceptProbability >= 1;
+      // Eve's output never leaves execute(), so the buffers persist
+      // across runs instead of being reallocated per click
+      if (this.eveBitsScratch === null) {
+        this.eveBitsScratch = new Uint32Array(words);
+        this.eveBasesScratch = new Uint32Array(words);
+      }
+      const outBits = this.eveBitsScratch;
+      const outBases = this.eveBasesScratch;
+      // Scale the probability to the uint32 range once, so each lane's
+      // decision is a single draw-and-compare (2^32 stays unwrapped so a
+      // probability of 1 intercepts every lane)
+      const threshold = interceptProbability * 0x100000000;
+      for (let w = 0; w < words; w++) {
+        // Per-qubit intercept decisions for this word's 32 lanes
+        // (skipped entirely when every lane is intercepted)
+        let intercept = 0xffffffff;
+        if (!interceptAll) {
+          intercept = 0;
+          for (let b = 0; b < 32; b++) {
+            if (randBits32() < threshold) intercept |= 1 << b;
+          }
+          intercept = intercept >>> 0;
+        }
+        const eveBases = randBits32();
+        const match = ~(bases[w] ^ eveBases) >>> 0;
+        // Eve's measurement outcome, then her resent qubits replace the
+        // originals only in the intercepted lanes
+        const measured = ((bits[w] & match) | (randBits32() & ~match)) >>> 0;
+        outBits[w] = ((bits[w] & ~intercept) | (measured & intercept)) >>> 0;
+        outBases[w] = ((bases[w] & ~intercept) | (eveBases & intercept)) >>> 0;
+      }
+      return { bits: outBits, bases: outBases };
+    }
   
-  // Full protocol execution
-  execute(withEavesdropper = false, eveInterceptRate = 0.5) {
-    // Step 1: Alice prepares qubits
-    const { aliceBits, aliceBases, qubits } = this.alicePrepare();
-    
-    // Step 2: Optional eavesdropper
-    let transmittedQubits = qubits;
-    if (withEavesdropper) {
-      transmittedQubits = this.eveIntercept(qubits, eveInterceptRate);
+    // Full protocol execution
+    execute(withEavesdropper = false, eveInterceptRate = 0.5) {
+      // Step 1: Alice prepares qubits
+      const { aliceBits, aliceBases } = this.alicePrepare();
+
+      // Step 2: Optional eavesdropper
+      let transmittedBits = aliceBits;
+      let transmittedBases = aliceBases;
+      if (withEavesdropper) {
+        ({ bits: transmittedBits, bases: transmittedBases } =
+          this.eveIntercept(aliceBits, aliceBases, eveInterceptRate));
+      }
+
+      // Step 3: Bob measures
+      const { bobBases, bobBits } = this.bobMeasure(transmittedBits, transmittedBases);
+
+      // Steps 4-6: sifting, error estimation and privacy amplification
+      // run as one fused pass
+      const { siftedAlice, siftedBob, errorCheck, finalKey } =
+        this.siftCheckAndExtract(aliceBits, aliceBases, bobBits, bobBases);
+
+      const result = {
+        errorCheck,
+        finalKey,
+        stats: {
+          transmitted: this.qubitCount,
+          sifted: siftedAlice.length,
+          finalKeyLength: finalKey.length,
+          siftingEfficiency: (siftedAlice.length / this.qubitCount * 100).toFixed(1),
+        }
+      };
+
+      // The raw per-qubit arrays are only retained when debugging -
+      // the UI never renders them, and keeping them in React state
+      // until the next run is pure GC pressure
+      if (this.debug) {
+        result.aliceBits = aliceBits;
+        result.aliceBases = aliceBases;
+        result.bobBits = bobBits;
+        result.bobBases = bobBases;
+        result.siftedAlice = siftedAlice;
+        result.siftedBob = siftedBob;
+      }
+
+      return result;
     }
-    
-    // Step 3: Bob measures
-    const { bobBases, bobBits } = this.bobMeasure(transmittedQubits);
-    
-    // Step 4: Sifting
-    const { siftedAlice, siftedBob, matchingIndices } = this.sift(
-      aliceBits, aliceBases, bobBits, bobBases
+  }
+
+  return { BB84Protocol, seedRng };
+}
+
+// Blob URL for the protocol worker, built once on first use
+let workerUrl = null;
+function getWorkerUrl() {
+  if (!workerUrl) {
+    const src = `
+      const { BB84Protocol, seedRng } = (${createBB84Module.toString()})();
+      let protocol = null;
+      onmessage = (e) => {
+        const { keyLength, withEve, eveRate, seed } = e.data;
+        if (seed !== undefined) seedRng(seed);
+        // Keep one instance per key length so its scratch buffers
+        // survive across runs
+        if (!protocol || protocol.keyLength !== keyLength) {
+          protocol = new BB84Protocol(keyLength);
+        }
+        const result = protocol.execute(withEve, eveRate);
+        // Transfer the key buffer instead of copying it
+        postMessage(result, [result.finalKey.buffer]);
+      };
+    `;
+    workerUrl = URL.createObjectURL(new Blob([src], { type: 'application/javascript' }));
+  }
+  return workerUrl;
+}
+
+
+// Hex conversion via a nibble lookup: each 4-bit group indexes one
+// character, written into a preallocated char-code buffer - no slice,
+// join or parseInt per nibble
+const HEX_CHARS = '0123456789ABCDEF';
+
+function bitsToHex(bits) {
+  const n = bits.length;
+  const codes = new Uint16Array((n + 3) >> 2);
+  let o = 0;
+  let i = 0;
+  for (; i + 4 <= n; i += 4) {
+    codes[o++] = HEX_CHARS.charCodeAt(
+      (bits[i] << 3) | (bits[i + 1] << 2) | (bits[i + 2] << 1) | bits[i + 3]
     );
-    
-    // Step 5: Error estimation
-    const errorCheck = this.estimateError(siftedAlice, siftedBob);
-    
-    // Step 6: Privacy amplification
-    const finalKey = this.privacyAmplification(siftedAlice, errorCheck.checkedIndices);
-    
-    return {
-      aliceBits,
-      aliceBases,
-      bobBits,
-      bobBases,
-      siftedAlice,
-      siftedBob,
-      matchingIndices,
-      errorCheck,
-      finalKey,
-      stats: {
-        transmitted: aliceBits.length,
-        sifted: siftedAlice.length,
-        finalKeyLength: finalKey.length,
-        siftingEfficiency: (siftedAlice.length / aliceBits.length * 100).toFixed(1),
-      }
-    };
   }
+  if (i < n) {
+    // Trailing partial nibble keeps the old right-aligned encoding
+    let nibble = 0;
+    for (; i < n; i++) nibble = (nibble << 1) | bits[i];
+    codes[o] = HEX_CHARS.charCodeAt(nibble);
+  }
+  return String.fromCharCode(...codes);
+}
+
+// Binary rendering through the same char-code buffer trick - a single
+// String.fromCharCode call instead of join('')'s per-element strings
+function bitsToBinary(bits) {
+  const codes = new Uint16Array(bits.length);
+  for (let i = 0; i < bits.length; i++) codes[i] = 48 + bits[i];
+  return String.fromCharCode(...codes);
 }
 
 // Main React Component
@@ -163,26 +332,37 @@ export default function BB84Dashboard() {
   const [eveRate, setEveRate] = useState(0.5);
   const [result, setResult] = useState(null);
   const [loading, setLoading] = useState(false);
+  const workerRef = useRef(null);
 
   const runProtocol = () => {
     setLoading(true);
-    setTimeout(() => {
-      const protocol = new BB84Protocol(keyLength);
-      const res = protocol.execute(withEve, eveRate);
-      setResult(res);
-      setLoading(false);
-    }, 100);
-  };
-
-  const bitsToHex = (bits) => {
-    let hex = '';
-    for (let i = 0; i < bits.length; i += 4) {
-      const chunk = bits.slice(i, i + 4).join('');
-      hex += parseInt(chunk, 2).toString(16);
+    // Run the protocol off the React thread so the UI keeps painting;
+    // the worker is created once and reused across runs
+    if (!workerRef.current) {
+      workerRef.current = new Worker(getWorkerUrl());
+      workerRef.current.onmessage = (e) => {
+        setResult(e.data);
+        setLoading(false);
+      };
     }
-    return hex.toUpperCase();
+    workerRef.current.postMessage({ keyLength, withEve, eveRate });
   };
 
+  // Key display strings only change when a run completes, not on every
+  // slider/checkbox render
+  const finalKeyBin = useMemo(() => (result ? bitsToBinary(result.finalKey) : ''), [result]);
+  const finalKeyHex = useMemo(() => (result ? bitsToHex(result.finalKey) : ''), [result]);
+
+  // Security presentation values - the threshold comparison and class
+  // strings are computed once per render instead of per JSX expression
+  const insecure = result ? result.errorCheck.errorRate > 0.11 : false;
+  const errorPct = result ? (result.errorCheck.errorRate * 100).toFixed(2) : '';
+  const qberTextCls = insecure ? 'text-red-400' : 'text-green-400';
+  const alertBoxCls = insecure
+    ? 'bg-red-500/20 border border-red-400/30'
+    : 'bg-green-500/20 border border-green-400/30';
+  const alertTextCls = insecure ? 'text-red-300' : 'text-green-300';
+
   return (
     <div className="min-h-screen bg-gradient-to-br from-purple-900 via-blue-900 to-indigo-900 p-8">
       <div className="max-w-6xl mx-auto">
@@ -296,7 +476,7 @@ export default function BB84Dashboard() {
             {/* Error Rate */}
             <div className="bg-white/10 backdrop-blur-lg rounded-xl p-6 border border-white/20">
               <h2 className="text-2xl font-bold text-white mb-4 flex items-center gap-2">
-                {result.errorCheck.errorRate > 0.11 ? (
+                {insecure ? (
                   <>
                     <AlertCircle className="w-6 h-6 text-red-400" />
                     Security Alert
@@ -311,29 +491,21 @@ export default function BB84Dashboard() {
               <div className="grid md:grid-cols-2 gap-4">
                 <div>
                   <div className="text-blue-200 mb-2">Quantum Bit Error Rate (QBER)</div>
-                  <div className={`text-4xl font-bold ${
-                    result.errorCheck.errorRate > 0.11 ? 'text-red-400' : 'text-green-400'
-                  }`}>
-                    {(result.errorCheck.errorRate * 100).toFixed(2)}%
+                  <div className={`text-4xl font-bold ${qberTextCls}`}>
+                    {errorPct}%
                   </div>
                   <div className="text-sm text-blue-300 mt-2">
                     {result.errorCheck.errors} errors in {result.errorCheck.sampleSize} checked bits
                   </div>
                 </div>
-                <div className={`rounded-lg p-4 ${
-                  result.errorCheck.errorRate > 0.11 
-                    ? 'bg-red-500/20 border border-red-400/30' 
-                    : 'bg-green-500/20 border border-green-400/30'
-                }`}>
-                  <div className={`font-bold mb-2 ${
-                    result.errorCheck.errorRate > 0.11 ? 'text-red-300' : 'text-green-300'
-                  }`}>
-                    {result.errorCheck.errorRate > 0.11 
-                      ? '⚠️ Eavesdropping Detected!' 
+                <div className={`rounded-lg p-4 ${alertBoxCls}`}>
+                  <div className={`font-bold mb-2 ${alertTextCls}`}>
+                    {insecure
+                      ? '⚠️ Eavesdropping Detected!'
                       : '✓ Channel Secure'}
                   </div>
                   <div className="text-sm text-white">
-                    {result.errorCheck.errorRate > 0.11
+                    {insecure
                       ? 'QBER exceeds 11% threshold. Possible eavesdropper present. Key should be discarded.'
                       : 'QBER within acceptable limits. Key exchange successful.'}
                   </div>
@@ -350,11 +522,11 @@ export default function BB84Dashboard() {
               <div className="bg-black/30 rounded-lg p-4 border border-cyan-400/30">
                 <div className="text-cyan-300 text-xs mb-2 font-mono">Binary Format:</div>
                 <div className="text-white font-mono text-sm break-all mb-4">
-                  {result.finalKey.join('')}
+                  {finalKeyBin}
                 </div>
                 <div className="text-cyan-300 text-xs mb-2 font-mono">Hexadecimal Format:</div>
                 <div className="text-white font-mono text-lg break-all">
-                  {bitsToHex(result.finalKey)}
+                  {finalKeyHex}
                 </div>
               </div>
             </div>